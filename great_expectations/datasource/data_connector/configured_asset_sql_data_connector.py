@@ -3,6 +3,7 @@ from typing import Dict, List, Optional
 
 import pandas as pd
 
+import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.batch import (
     BatchDefinition,
     BatchSpec,
@@ -10,16 +11,12 @@ from great_expectations.core.batch import (
 )
 from great_expectations.datasource.data_connector.asset.asset import Asset
 from great_expectations.datasource.data_connector.data_connector import DataConnector
+from great_expectations.datasource.data_connector.import_manager import sa
 from great_expectations.datasource.data_connector.util import (
     batch_definition_matches_batch_request,
 )
 from great_expectations.execution_engine import ExecutionEngine
 
-try:
-    import sqlalchemy as sa
-except ImportError:
-    sa = None
-
 
 class ConfiguredAssetSqlDataConnector(DataConnector):
     def __init__(
@@ -29,6 +26,11 @@ class ConfiguredAssetSqlDataConnector(DataConnector):
         execution_engine: Optional[ExecutionEngine] = None,
         data_assets: Optional[Dict[str, Asset]] = None,
     ):
+        if sa is None:
+            raise ge_exceptions.DataConnectorError(
+                f"{self.__class__.__name__} requires sqlalchemy, which is not installed."
+            )
+
         self._data_assets = data_assets
 
         super().__init__(
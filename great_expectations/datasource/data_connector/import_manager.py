@@ -0,0 +1,14 @@
+"""
+This file manages the optional imports shared by the SQL data connectors, so that their error handling is centralized
+"""
+import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    import sqlalchemy as sa
+    from sqlalchemy.exc import OperationalError
+except ImportError:
+    logger.debug("No SqlAlchemy module available.")
+    sa = None
+    OperationalError = None
@@ -1,19 +1,66 @@
-from typing import Dict, List, Optional
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+from weakref import WeakKeyDictionary
 
 from great_expectations.datasource.data_connector import ConfiguredAssetSqlDataConnector
 from great_expectations.datasource.data_connector.asset import Asset
+from great_expectations.datasource.data_connector.import_manager import (
+    OperationalError,
+    sa,
+)
 from great_expectations.execution_engine import ExecutionEngine
 
-try:
-    import sqlalchemy as sa
-    from sqlalchemy.exc import OperationalError
-except ImportError:
-    sa = None
+MAX_CONCURRENT_PARTITION_PROBES = 8
+# Number of tables whose partition queries are combined into one UNION ALL statement
+PARTITION_PROBE_BATCH_SIZE = 50
+
+# Schemas and tables that _introspect_db ignores by default
+_INFORMATION_SCHEMAS = frozenset(
+    {
+        "INFORMATION_SCHEMA",  # snowflake, mssql, mysql, oracle
+        "information_schema",  # postgres, redshift, mysql
+        "performance_schema",  # mysql
+        "sys",  # mysql
+        "mysql",  # mysql
+    }
+)
+_SYSTEM_TABLES = frozenset({"sqlite_master"})  # sqlite
+
+# A row of introspected table metadata, with its "schema.table" name computed once
+TableMeta = namedtuple("TableMeta", ["schema_name", "table_name", "fqn", "type"])
+
+# Catalog relations that list every table and view in a single query, keyed on dialect name.
+# Each one must yield table_schema, table_name and table_type ("BASE TABLE" or "VIEW") columns.
+_INFORMATION_SCHEMA_TABLES = (
+    "SELECT table_schema, table_name, table_type FROM information_schema.tables"
+)
+_MSSQL_TABLES_AND_VIEWS = (
+    "SELECT s.name AS table_schema, t.name AS table_name, 'BASE TABLE' AS table_type "
+    "FROM sys.tables t JOIN sys.schemas s ON t.schema_id = s.schema_id "
+    "UNION ALL "
+    "SELECT s.name AS table_schema, v.name AS table_name, 'VIEW' AS table_type "
+    "FROM sys.views v JOIN sys.schemas s ON v.schema_id = s.schema_id"
+)
+# Only dialects whose query lists the same tables and views as the inspector belong here. On postgres and redshift,
+# information_schema.tables leaves out materialized views and the tables that the user has no privileges on.
+BULK_TABLE_LISTING_QUERIES = {
+    "mysql": _INFORMATION_SCHEMA_TABLES,
+    "snowflake": _INFORMATION_SCHEMA_TABLES,
+    "mssql": _MSSQL_TABLES_AND_VIEWS,
+}
 
 
 class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
     """A DataConnector that infers data_asset names by introspecting a SQL database
 
+    When introspection_cache_ttl_seconds is set, introspection results are cached for the whole process, per engine
+    object: every InferredAssetSqlDataConnector (in any Datasource) that introspects the same engine with the same
+    directives and table filters reuses them until the TTL runs out, or until self_check (e.g. through
+    test_yaml_config) introspects the database again.
+
     Args:
         name (str): The name of this DataConnector
         datasource_name (str): The name of the Datasource that contains it
@@ -31,8 +78,15 @@ class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
             If True, tables that can't be successfully queried using sampling and splitter methods are excluded from inferred data_asset_names.
             If False, the class will throw an error during initialization if any such tables are encountered.
         introspection_directives (Dict): Arguments passed to the introspection method to guide introspection
+        introspection_cache_ttl_seconds (float):
+            How long the results of introspecting the database are reused by later refreshes, including those of
+            other InferredAssetSqlDataConnectors introspecting the same engine in the same way.
+            0 (the default) disables the cache; None keeps the results until a refresh is explicitly requested.
     """
 
+    # Introspection results shared by all connectors, as {engine: {introspection key: (timestamp, table metadata)}}
+    _catalog_cache = WeakKeyDictionary()
+
     def __init__(
         self,
         name: str,
@@ -49,6 +103,7 @@ class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
         included_tables: List = None,
         skip_inapplicable_tables: bool = True,
         introspection_directives: Dict = None,
+        introspection_cache_ttl_seconds: Optional[float] = 0,
     ):
         self._data_asset_name_prefix = data_asset_name_prefix
         self._data_asset_name_suffix = data_asset_name_suffix
@@ -57,11 +112,31 @@ class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
         self._splitter_kwargs = splitter_kwargs
         self._sampling_method = sampling_method
         self._sampling_kwargs = sampling_kwargs
-        self._excluded_tables = excluded_tables
-        self._included_tables = included_tables
+        self._excluded_tables = (
+            None if excluded_tables is None else frozenset(excluded_tables)
+        )
+        self._included_tables = (
+            None if included_tables is None else frozenset(included_tables)
+        )
         self._skip_inapplicable_tables = skip_inapplicable_tables
 
         self._introspection_directives = introspection_directives or {}
+        self._introspection_cache_ttl_seconds = introspection_cache_ttl_seconds
+
+        # Connectors that introspect the same engine with the same arguments share their results in _catalog_cache
+        self._introspection_cache_key = repr(
+            (
+                sorted(self._introspection_directives.items()),
+                None
+                if self._included_tables is None
+                else sorted(self._included_tables),
+                None
+                if self._excluded_tables is None
+                else sorted(self._excluded_tables),
+            )
+        )
+        # Tables whose partition probe succeeded
+        self._partition_validation_cache = set()
 
         super().__init__(
             name=name,
@@ -91,8 +166,8 @@ class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
     def data_assets(self) -> Dict[str, Asset]:
         return self._introspected_data_assets_cache
 
-    def _refresh_data_references_cache(self):
-        self._refresh_introspected_data_assets_cache(
+    def _refresh_data_references_cache(self, refresh: bool = False):
+        probed_partition_definition_lists = self._refresh_introspected_data_assets_cache(
             self._data_asset_name_prefix,
             self._data_asset_name_suffix,
             self._include_schema_name,
@@ -103,9 +178,38 @@ class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
             self._excluded_tables,
             self._included_tables,
             self._skip_inapplicable_tables,
+            refresh=refresh,
         )
 
-        super()._refresh_data_references_cache()
+        # Tables probed by this refresh already returned their partition_definitions; don't query them again.
+        self._data_references_cache = {}
+        for data_asset_name, data_asset in list(self.data_assets.items()):
+            partition_definition_list = probed_partition_definition_lists.get(
+                data_asset_name
+            )
+            if partition_definition_list is None:
+                try:
+                    partition_definition_list = self._get_partition_definition_list_from_data_asset_config(
+                        data_asset_name, data_asset,
+                    )
+                except OperationalError as e:
+                    # An earlier refresh validated this table, but it can't be queried anymore
+                    self._partition_validation_cache.discard(data_asset["table_name"])
+                    if self._skip_inapplicable_tables:
+                        del self._introspected_data_assets_cache[data_asset_name]
+                        continue
+
+                    else:
+                        raise ValueError(
+                            f"Couldn't execute a query against table {data_asset['table_name']}"
+                        ) from e
+
+            self._data_references_cache[data_asset_name] = partition_definition_list
+
+    def self_check(self, pretty_print=True, max_examples=3):
+        # Report on the database as it is now, rather than on introspection cached by this or any other connector
+        self._refresh_data_references_cache(refresh=True)
+        return super().self_check(pretty_print=pretty_print, max_examples=max_examples)
 
     def _refresh_introspected_data_assets_cache(
         self,
@@ -119,56 +223,77 @@ class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
         excluded_tables: List = None,
         included_tables: List = None,
         skip_inapplicable_tables: bool = True,
-    ):
-        introspected_table_metadata = self._introspect_db(
-            **self._introspection_directives
+        refresh: bool = False,
+    ) -> Dict[str, List[dict]]:
+        """Introspect the database into _introspected_data_assets_cache.
+
+        Returns the partition_definition lists fetched while probing tables, keyed by data_asset_name.
+        """
+        if refresh:
+            self._partition_validation_cache = set()
+
+        introspected_table_metadata = self._get_introspected_table_metadata(
+            refresh=refresh
         )
+        # These keys are the same for every table, so build them once
+        base_data_asset_config = {}
+        if splitter_method is not None:
+            base_data_asset_config["splitter_method"] = splitter_method
+        if splitter_kwargs is not None:
+            base_data_asset_config["splitter_kwargs"] = splitter_kwargs
+        if sampling_method is not None:
+            base_data_asset_config["sampling_method"] = sampling_method
+        if sampling_kwargs is not None:
+            base_data_asset_config["sampling_kwargs"] = sampling_kwargs
+
+        candidate_data_assets = []
         for metadata in introspected_table_metadata:
-            if (excluded_tables is not None) and (
-                metadata["schema_name"] + "." + metadata["table_name"]
-                in excluded_tables
-            ):
+            if (excluded_tables is not None) and (metadata.fqn in excluded_tables):
                 continue
 
-            if (included_tables is not None) and (
-                metadata["schema_name"] + "." + metadata["table_name"]
-                not in included_tables
-            ):
+            if (included_tables is not None) and (metadata.fqn not in included_tables):
                 continue
 
-            if include_schema_name:
-                data_asset_name = (
-                    data_asset_name_prefix
-                    + metadata["schema_name"]
-                    + "."
-                    + metadata["table_name"]
-                    + data_asset_name_suffix
-                )
-            else:
-                data_asset_name = (
-                    data_asset_name_prefix
-                    + metadata["table_name"]
-                    + data_asset_name_suffix
-                )
+            # Interned, since data_asset_names are the keys of every later data_assets lookup
+            table_name = metadata.fqn if include_schema_name else metadata.table_name
+            data_asset_name = sys.intern(
+                f"{data_asset_name_prefix}{table_name}{data_asset_name_suffix}"
+            )
 
             data_asset_config = {
-                "table_name": metadata["schema_name"] + "." + metadata["table_name"],
+                "table_name": metadata.fqn,
+                **base_data_asset_config,
             }
-            if not splitter_method is None:
-                data_asset_config["splitter_method"] = splitter_method
-            if not splitter_kwargs is None:
-                data_asset_config["splitter_kwargs"] = splitter_kwargs
-            if not sampling_method is None:
-                data_asset_config["sampling_method"] = sampling_method
-            if not sampling_kwargs is None:
-                data_asset_config["sampling_kwargs"] = sampling_kwargs
-
-            # Attempt to fetch a list of partition_definitions from the table
-            try:
-                self._get_partition_definition_list_from_data_asset_config(
-                    data_asset_name, data_asset_config,
-                )
-            except OperationalError as e:
+
+            candidate_data_assets.append((metadata, data_asset_name, data_asset_config))
+
+        # Attempt to fetch a list of partition_definitions from each table, unless an earlier refresh already did.
+        # Without a splitter_method that doesn't query the table, so there is nothing to probe.
+        if splitter_method is None:
+            unvalidated_data_assets = []
+        else:
+            unvalidated_data_assets = [
+                (data_asset_name, data_asset_config)
+                for _, data_asset_name, data_asset_config in candidate_data_assets
+                if data_asset_config["table_name"]
+                not in self._partition_validation_cache
+            ]
+        probe_results = dict(
+            zip(
+                [
+                    data_asset_config["table_name"]
+                    for _, data_asset_config in unvalidated_data_assets
+                ],
+                self._probe_data_assets(unvalidated_data_assets),
+            )
+        )
+
+        probed_partition_definition_lists = {}
+        for metadata, data_asset_name, data_asset_config in candidate_data_assets:
+            partition_definition_list, e = probe_results.get(
+                data_asset_config["table_name"], (None, None)
+            )
+            if e is not None:
                 # If it doesn't work, then...
                 if skip_inapplicable_tables:
                     # No harm done. Just don't include this table in the list of data_assets.
@@ -177,30 +302,177 @@ class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
                 else:
                     # We're being strict. Crash now.
                     raise ValueError(
-                        f"Couldn't execute a query against table {metadata['table_name']} in schema {metadata['schema_name']}"
+                        f"Couldn't execute a query against table {metadata.table_name} in schema {metadata.schema_name}"
                     ) from e
 
+            self._partition_validation_cache.add(data_asset_config["table_name"])
+            if partition_definition_list is not None:
+                probed_partition_definition_lists[
+                    data_asset_name
+                ] = partition_definition_list
+
             # Store an asset config for each introspected data asset.
             self._introspected_data_assets_cache[data_asset_name] = data_asset_config
 
+        return probed_partition_definition_lists
+
+    def _probe_data_assets(self, data_assets: List[tuple]) -> List[tuple]:
+        """Run the partition query for each (data_asset_name, data_asset_config).
+
+        Returns a (partition_definition_list, OperationalError) pair for each one, where exactly one of them is None.
+
+        The queries of up to PARTITION_PROBE_BATCH_SIZE tables are sent as a single statement. Batches run concurrently
+        when the execution engine holds a pooled Engine, since each query then checks out its own connection. A single
+        shared Connection is not safe to use from several threads, so it is probed serially.
+        """
+        batches = [
+            data_assets[i : i + PARTITION_PROBE_BATCH_SIZE]
+            for i in range(0, len(data_assets), PARTITION_PROBE_BATCH_SIZE)
+        ]
+
+        engine = self._execution_engine.engine
+        if len(batches) > 1 and isinstance(engine, sa.engine.Engine):
+            with ThreadPoolExecutor(
+                max_workers=min(len(batches), MAX_CONCURRENT_PARTITION_PROBES)
+            ) as executor:
+                batch_results = list(
+                    executor.map(self._probe_data_asset_batch, batches)
+                )
+        else:
+            batch_results = [self._probe_data_asset_batch(batch) for batch in batches]
+
+        return [result for results in batch_results for result in results]
+
+    def _probe_data_asset_batch(self, data_assets: List[tuple]) -> List[tuple]:
+        if len(data_assets) == 1:
+            return [self._probe_data_asset(*data_assets[0])]
+
+        try:
+            partition_definition_lists = self._get_partition_definition_lists_from_data_asset_configs(
+                data_assets
+            )
+        except sa.exc.DBAPIError:
+            # At least one of the tables can't be queried. Query them one at a time to find out which.
+            return [self._probe_data_asset(*args) for args in data_assets]
+
+        return [
+            (partition_definition_list, None)
+            for partition_definition_list in partition_definition_lists
+        ]
+
+    def _get_partition_definition_lists_from_data_asset_configs(
+        self, data_assets: List[tuple]
+    ) -> List[List[dict]]:
+        """Fetch the partition_definitions of several (data_asset_name, data_asset_config) with one UNION ALL query.
+
+        All of the configs must share the same splitter_method and splitter_kwargs. Each split query is tagged with its
+        position, so that the rows can be handed back to the right data asset.
+        """
+        tagged_split_queries = []
+        for i, (data_asset_name, data_asset_config) in enumerate(data_assets):
+            splitter_fn = getattr(self, data_asset_config["splitter_method"])
+            split_query = splitter_fn(
+                table_name=data_asset_config["table_name"],
+                **data_asset_config["splitter_kwargs"],
+            ).alias(f"split_query_{i}")
+            tagged_split_queries.append(
+                sa.select([sa.literal(i).label("probe_index"), *split_query.c])
+            )
+
+        rows = self._execution_engine.engine.execute(
+            sa.union_all(*tagged_split_queries)
+        ).fetchall()
+
+        # Zip up split parameters with column names
+        column_names = self._get_column_names_from_splitter_kwargs(
+            data_assets[0][1]["splitter_kwargs"]
+        )
+        partition_definition_lists = [[] for _ in data_assets]
+        for row in rows:
+            partition_definition_lists[row[0]].append(dict(zip(column_names, row[1:])))
+
+        return partition_definition_lists
+
+    def _probe_data_asset(self, data_asset_name: str, data_asset_config: dict) -> tuple:
+        try:
+            return (
+                self._get_partition_definition_list_from_data_asset_config(
+                    data_asset_name, data_asset_config,
+                ),
+                None,
+            )
+        except OperationalError as e:
+            return None, e
+
+    def _get_introspected_table_metadata(
+        self, refresh: bool = False
+    ) -> List[TableMeta]:
+        """Return _introspect_db's result as TableMeta rows, reused while it is younger than the cache TTL."""
+        engine_catalog_cache = self._catalog_cache.setdefault(
+            self._execution_engine.engine, {}
+        )
+        now = time.monotonic()
+        ttl = self._introspection_cache_ttl_seconds
+        cached_table_metadata = engine_catalog_cache.get(self._introspection_cache_key)
+        if (
+            not refresh
+            and cached_table_metadata is not None
+            and (ttl is None or now - cached_table_metadata[0] < ttl)
+        ):
+            return cached_table_metadata[1]
+
+        introspected_table_metadata = [
+            TableMeta(
+                metadata["schema_name"],
+                metadata["table_name"],
+                f"{metadata['schema_name']}.{metadata['table_name']}",
+                metadata["type"],
+            )
+            for metadata in self._introspect_db(
+                included_tables=self._included_tables,
+                excluded_tables=self._excluded_tables,
+                **self._introspection_directives,
+            )
+        ]
+        engine_catalog_cache[self._introspection_cache_key] = (
+            now,
+            introspected_table_metadata,
+        )
+        return introspected_table_metadata
+
     def _introspect_db(
         self,
         schema_name: str = None,
         ignore_information_schemas_and_system_tables: bool = True,
-        information_schemas: List[str] = [
-            "INFORMATION_SCHEMA",  # snowflake, mssql, mysql, oracle
-            "information_schema",  # postgres, redshift, mysql
-            "performance_schema",  # mysql
-            "sys",  # mysql
-            "mysql",  # mysql
-        ],
-        system_tables: List[str] = ["sqlite_master"],  # sqlite
+        information_schemas: Iterable[str] = _INFORMATION_SCHEMAS,
+        system_tables: Iterable[str] = _SYSTEM_TABLES,
         include_views=True,
+        included_tables: List[str] = None,
+        excluded_tables: List[str] = None,
     ):
         engine = self._execution_engine.engine
+
+        tables = self._bulk_list_tables(
+            engine,
+            schema_name=schema_name,
+            ignore_information_schemas_and_system_tables=ignore_information_schemas_and_system_tables,
+            information_schemas=information_schemas,
+            system_tables=system_tables,
+            include_views=include_views,
+            included_tables=included_tables,
+            excluded_tables=excluded_tables,
+        )
+        if tables is not None:
+            return tables
+
         inspector = sa.inspect(engine)
 
         selected_schema_name = schema_name
+        included_schema_names = (
+            None
+            if included_tables is None
+            else {schema_name for schema_name, _ in _split_table_names(included_tables)}
+        )
 
         tables = []
         for schema_name in inspector.get_schema_names():
@@ -213,6 +485,13 @@ class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
             if selected_schema_name is not None and schema_name != selected_schema_name:
                 continue
 
+            # Don't list the tables of schemas that can't contain any included table
+            if (
+                included_schema_names is not None
+                and schema_name not in included_schema_names
+            ):
+                continue
+
             for table_name in inspector.get_table_names(schema=schema_name):
 
                 if (ignore_information_schemas_and_system_tables) and (
@@ -228,14 +507,13 @@ class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
                     }
                 )
 
-            # Note Abe 20201112: This logic is currently untested.
             if include_views:
                 # Note: this is not implemented for bigquery
 
                 for view_name in inspector.get_view_names(schema=schema_name):
 
                     if (ignore_information_schemas_and_system_tables) and (
-                        table_name in system_tables
+                        view_name in system_tables
                     ):
                         continue
 
@@ -247,4 +525,142 @@ class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
                         }
                     )
 
+        if included_tables is not None or excluded_tables is not None:
+            tables = [
+                table
+                for table in tables
+                if (
+                    included_tables is None
+                    or f"{table['schema_name']}.{table['table_name']}"
+                    in included_tables
+                )
+                and (
+                    excluded_tables is None
+                    or f"{table['schema_name']}.{table['table_name']}"
+                    not in excluded_tables
+                )
+            ]
+
         return tables
+
+    @staticmethod
+    def _bulk_list_tables(
+        engine,
+        schema_name: str = None,
+        ignore_information_schemas_and_system_tables: bool = True,
+        information_schemas: Iterable[str] = None,
+        system_tables: Iterable[str] = None,
+        include_views: bool = True,
+        included_tables: List[str] = None,
+        excluded_tables: List[str] = None,
+    ) -> Optional[List[dict]]:
+        """List every table (and optionally view) with one catalog query instead of per-schema inspector calls.
+
+        included_tables and excluded_tables ("schema.table" names) are applied in the query's WHERE clause, so that
+        only candidate tables are sent back by the database.
+
+        Returns None for dialects without an entry in BULK_TABLE_LISTING_QUERIES, so that the caller can fall back
+        to the inspector.
+        """
+        dialect = engine.dialect
+        catalog_query = BULK_TABLE_LISTING_QUERIES.get(dialect.name)
+        if catalog_query is None:
+            return None
+
+        table_types = ["BASE TABLE"]
+        if include_views:
+            table_types.append("VIEW")
+
+        conditions = ["table_type IN :table_types"]
+        params = {"table_types": table_types}
+        if ignore_information_schemas_and_system_tables and information_schemas:
+            conditions.append("table_schema NOT IN :information_schemas")
+            params["information_schemas"] = list(information_schemas)
+        if schema_name is not None:
+            conditions.append("table_schema = :schema_name")
+            params["schema_name"] = (
+                dialect.denormalize_name(schema_name)
+                if dialect.requires_name_normalize
+                else schema_name
+            )
+        if included_tables is not None:
+            included_table_names = _split_table_names(included_tables, dialect)
+            if not included_table_names:
+                return []
+
+            conditions.append(
+                "("
+                + " OR ".join(
+                    f"(table_schema = :included_schema_{i} AND table_name = :included_table_{i})"
+                    for i in range(len(included_table_names))
+                )
+                + ")"
+            )
+            for i, (included_schema, included_table) in enumerate(included_table_names):
+                params[f"included_schema_{i}"] = included_schema
+                params[f"included_table_{i}"] = included_table
+        if excluded_tables is not None:
+            for i, (excluded_schema, excluded_table) in enumerate(
+                _split_table_names(excluded_tables, dialect)
+            ):
+                conditions.append(
+                    f"NOT (table_schema = :excluded_schema_{i} AND table_name = :excluded_table_{i})"
+                )
+                params[f"excluded_schema_{i}"] = excluded_schema
+                params[f"excluded_table_{i}"] = excluded_table
+
+        query = sa.text(
+            f"SELECT table_schema, table_name, table_type FROM ({catalog_query}) AS catalog_tables "
+            f"WHERE {' AND '.join(conditions)} "
+            "ORDER BY table_schema, table_type, table_name"
+        ).bindparams(
+            *[
+                sa.bindparam(name, expanding=True)
+                for name in ("table_types", "information_schemas")
+                if name in params
+            ]
+        )
+
+        tables = []
+        for row_schema_name, row_table_name, row_table_type in engine.execute(
+            query, params
+        ):
+            if dialect.requires_name_normalize:
+                row_schema_name = dialect.normalize_name(row_schema_name)
+                row_table_name = dialect.normalize_name(row_table_name)
+
+            if (
+                ignore_information_schemas_and_system_tables
+                and system_tables
+                and row_table_name in system_tables
+            ):
+                continue
+
+            tables.append(
+                {
+                    "schema_name": row_schema_name,
+                    "table_name": row_table_name,
+                    "type": "view" if row_table_type == "VIEW" else "table",
+                }
+            )
+
+        return tables
+
+
+def _split_table_names(table_names: List[str], dialect=None) -> List[tuple]:
+    """Split "schema.table" names into (schema, table) pairs, in the dialect's catalog casing if it has one.
+
+    Names without a schema can't match an introspected table, so they are dropped.
+    """
+    split_table_names = []
+    for table_name in table_names:
+        if "." not in table_name:
+            continue
+
+        schema_name, table_name = table_name.split(".", 1)
+        if dialect is not None and dialect.requires_name_normalize:
+            schema_name = dialect.denormalize_name(schema_name)
+            table_name = dialect.denormalize_name(table_name)
+        split_table_names.append((schema_name, table_name))
+
+    return split_table_names
@@ -1,10 +1,18 @@
 import copy
 import datetime
 import hashlib
+import importlib.util
 import logging
-import uuid
+import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache, reduce
+from operator import and_
 from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
 
+import pandas as pd
+
 from great_expectations.core.batch import BatchMarkers, BatchSpec
 from great_expectations.core.id_dict import IDDict
 from great_expectations.datasource.types.batch_spec import (
@@ -34,20 +42,37 @@ logger = logging.getLogger(__name__)
 try:
     import pyspark
     import pyspark.sql.functions as F
+    from pyspark import SparkContext, StorageLevel
     from pyspark.sql import DataFrame, SparkSession
     from pyspark.sql.types import (
         BooleanType,
         DateType,
         FloatType,
         IntegerType,
+        LongType,
+        NumericType,
         StringType,
         StructField,
         StructType,
     )
 
+    # Types that Arrow converts to the same python values as collect()
+    ARROW_COLLECTABLE_TYPES = (NumericType, StringType, BooleanType, DateType)
+
+    PYSPARK_VERSION: Tuple[int, ...] = tuple(
+        int(part) for part in re.findall(r"\d+", pyspark.__version__)[:2]
+    )
+
+    # DataFrame._collect_as_arrow is private API, callable without arguments from pyspark 2.3 through 3.x
+    ARROW_COLLECT_SUPPORTED = (2, 3) <= PYSPARK_VERSION < (4, 0) and hasattr(
+        DataFrame, "_collect_as_arrow"
+    )
+
     class SparkDFBatchData(DataFrame):
-        def __init__(self, df):
+        def __init__(self, df, persisted_by_engine: bool = False):
             super(self.__class__, self).__init__(df._jdf, df.sql_ctx)
+            # Batches persisted by the execution engine are unpersisted by it once they are replaced
+            self._persisted_by_engine = persisted_by_engine
 
         def row_count(self):
             return self.count()
@@ -55,7 +80,10 @@ try:
 
 except ImportError:
     pyspark = None
+    PYSPARK_VERSION = ()
+    SparkContext = None
     SparkSession = None
+    StorageLevel = None
     DataFrame = None
     F = None
     StructType = (None,)
@@ -65,6 +93,8 @@ except ImportError:
     StringType = (None,)
     DateType = (None,)
     BooleanType = (None,)
+    ARROW_COLLECTABLE_TYPES = ()
+    ARROW_COLLECT_SUPPORTED = False
 
     SparkDFBatchData = None
 
@@ -72,11 +102,112 @@ except ImportError:
         "Unable to load pyspark; install optional spark dependency for support."
     )
 
+# hashlib function names that have a native Spark SQL counterpart, mapped to a builder of the hex digest expression.
+# Hashing natively keeps the computation inside the JVM instead of shipping every row to a Python worker.
+SPARK_NATIVE_HASH_FUNCTIONS: Dict[str, Callable] = {
+    "md5": lambda column: F.md5(column),
+    "sha1": lambda column: F.sha1(column),
+    "sha224": lambda column: F.sha2(column, 224),
+    "sha256": lambda column: F.sha2(column, 256),
+    "sha384": lambda column: F.sha2(column, 384),
+    "sha512": lambda column: F.sha2(column, 512),
+}
+
+
+# Maximum number of metric bundle aggregations that resolve_metric_bundle runs concurrently
+MAX_CONCURRENT_BUNDLE_JOBS = 8
+
+# Maximum number of row-condition-filtered compute domains that the engine keeps persisted at once
+COMPUTE_DOMAIN_CACHE_SIZE = 4
+
+# Above this many values, _sample_using_a_list matches values with a broadcast join instead of an IN predicate
+SAMPLE_USING_A_LIST_BROADCAST_THRESHOLD = 1000
+
+# Date format strings whose formatted values each cover one contiguous time range, mapped to a builder of the end of the
+# range (in seconds since epoch) from its start (in seconds since epoch) and its starting date.
+CONTIGUOUS_DATETIME_FORMAT_RANGE_ENDS: Dict[str, Callable] = {
+    "yyyy": lambda start, start_date: F.unix_timestamp(F.add_months(start_date, 12)),
+    "yyyy-MM": lambda start, start_date: F.unix_timestamp(F.add_months(start_date, 1)),
+    "yyyy-MM-dd": lambda start, start_date: F.unix_timestamp(F.date_add(start_date, 1)),
+    "yyyy-MM-dd HH": lambda start, start_date: start + 60 * 60,
+    "yyyy-MM-dd HH:mm": lambda start, start_date: start + 60,
+    "yyyy-MM-dd HH:mm:ss": lambda start, start_date: start + 1,
+}
+
+
+def _now_marker() -> BatchMarkers:
+    """Build batch markers recording the current (UTC) time as the batch load time"""
+    return BatchMarkers(
+        {"ge_load_time": datetime.datetime.utcnow().strftime("%Y%m%dT%H%M%S.%fZ")}
+    )
+
+
+def _check_integer_argument(argument_name: str, value):
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise ExecutionEngineError(
+            f"{argument_name} must be an integer, but {repr(value)} was given."
+        )
+
+
+def _positive_mod(column, mod: int):
+    """Take `column` modulo `mod`, with the sign of `mod` like python's (and PandasExecutionEngine's) modulo"""
+    _check_integer_argument("mod", mod)
+    return ((column % mod) + mod) % mod
+
+
+def _get_hash_udf(hash_function_name: str, hash_digits: int):
+    """Get a UDF returning the trailing `hash_digits` hex characters of the hashed value of its input.
+
+    UDFs are reused within a SparkContext rather than serialized and registered again for every split or sample.
+    """
+    return _build_hash_udf(
+        hash_function_name=hash_function_name,
+        hash_digits=hash_digits,
+        spark_application_id=SparkContext.getOrCreate().applicationId,
+    )
+
+
+@lru_cache(maxsize=32)
+def _build_hash_udf(
+    hash_function_name: str, hash_digits: int, spark_application_id: str
+):
+    """Build a UDF returning the trailing `hash_digits` hex characters of the hashed value of its input.
+
+    The rows are transferred to the python worker as Arrow batches instead of being pickled one at a time: natively on
+    Spark 3.5+, and through a vectorized pandas UDF on older versions if pyarrow is available.
+    spark_application_id is not used to build the UDF; it only keeps UDFs bound to a stopped SparkContext from being
+    reused.
+    """
+
+    def _encrypt_value(to_encode):
+        to_encode_str = str(to_encode)
+        hash_func = getattr(hashlib, hash_function_name)
+        hashed_value = hash_func(to_encode_str.encode()).hexdigest()[-1 * hash_digits :]
+        return hashed_value
+
+    def _encrypt_values(to_encode: pd.Series) -> pd.Series:
+        return to_encode.map(_encrypt_value)
+
+    if PYSPARK_VERSION >= (3, 5):
+        return F.udf(_encrypt_value, StringType(), useArrow=True)
+    if importlib.util.find_spec("pyarrow") is None:
+        return F.udf(_encrypt_value, StringType())
+    if PYSPARK_VERSION >= (3, 0):
+        # The pandas UDF type is inferred from the type hints
+        return F.pandas_udf(_encrypt_values, StringType())
+    return F.pandas_udf(_encrypt_values, StringType(), F.PandasUDFType.SCALAR)
+
 
 class SparkDFExecutionEngine(ExecutionEngine):
     """
 This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
 
+When `persist` is enabled (the default), the engine persists the batches whose batch_spec sets a `cache_level`
+("memory", "disk" or "memory_and_disk"), and the COMPUTE_DOMAIN_CACHE_SIZE most recently used row-condition-filtered
+compute domains. These are released when their batch_id is loaded again (or, for compute domains, when they fall out of
+the cache); the engine has no other teardown, so whoever creates the engine should call `unpersist_all()` once it is
+done validating its batches.
+
 --ge-feature-maturity-info--
 
     id: validation_engine_pyspark_self_managed
@@ -153,10 +284,25 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
         "reader_options",
     }
 
+    # Reader functions for the common reader methods; other reader methods are looked up on the DataFrameReader by name
+    reader_fn_factories: Dict[str, Callable] = {
+        "csv": lambda reader: reader.csv,
+        "parquet": lambda reader: reader.parquet,
+        "json": lambda reader: reader.json,
+        "orc": lambda reader: reader.orc,
+        "text": lambda reader: reader.text,
+        "delta": lambda reader: reader.format("delta").load,
+    }
+
     def __init__(self, *args, **kwargs):
         # Creation of the Spark DataFrame is done outside this class
         self._persist = kwargs.pop("persist", True)
         self._spark_config = kwargs.pop("spark_config", {})
+        # Row-condition-filtered batches, keyed by (batch_id, condition_parser, row_condition) and ordered from least to
+        # most recently used; only used when persisting
+        self._compute_domain_cache: OrderedDict = OrderedDict()
+        # Spark Columns parsed from great_expectations__experimental__ row conditions, keyed by row_condition
+        self._parsed_row_conditions: Dict[str, Any] = {}
         try:
             builder = SparkSession.builder
             app_name: Optional[str] = self._spark_config.pop("spark.app.name", None)
@@ -177,6 +323,43 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
             {"persist": self._persist, "spark_config": self._spark_config,}
         )
 
+    @contextmanager
+    def _arrow_transfer(self):
+        """Use Arrow for moving data from the JVM to python (e.g. toPandas) within the context.
+
+        The session configuration is restored afterwards, since Arrow also changes how pandas data is converted into
+        Spark (e.g. NaN becomes null). Keys explicitly set in spark_config are left alone.
+        """
+        if importlib.util.find_spec("pyarrow") is None:
+            yield
+            return
+
+        if PYSPARK_VERSION >= (3, 0):
+            arrow_config = {
+                "spark.sql.execution.arrow.pyspark.enabled": "true",
+                "spark.sql.execution.arrow.pyspark.fallback.enabled": "true",
+            }
+        else:
+            arrow_config = {
+                "spark.sql.execution.arrow.enabled": "true",
+                "spark.sql.execution.arrow.fallback.enabled": "true",
+            }
+        previous_config = {
+            key: self.spark.conf.get(key, None)
+            for key in arrow_config
+            if key not in self._spark_config
+        }
+        for key in previous_config:
+            self.spark.conf.set(key, arrow_config[key])
+        try:
+            yield
+        finally:
+            for key, value in previous_config.items():
+                if value is None:
+                    self.spark.conf.unset(key)
+                else:
+                    self.spark.conf.set(key, value)
+
     @property
     def dataframe(self):
         """If a batch has been loaded, returns a Spark Dataframe containing the data within the loaded batch"""
@@ -187,19 +370,50 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
 
         return self.active_batch_data
 
+    def load_batch_data(self, batch_id: str, batch_data: Any) -> None:
+        previous_batch_data = self.loaded_batch_data_dict.get(batch_id)
+        if previous_batch_data is not batch_data and getattr(
+            previous_batch_data, "_persisted_by_engine", False
+        ):
+            persisted_by_engine: bool = getattr(
+                batch_data, "_persisted_by_engine", False
+            )
+            storage_level = batch_data.storageLevel if persisted_by_engine else None
+            previous_batch_data.unpersist()
+            previous_batch_data._persisted_by_engine = False
+            # Spark shares cached data between DataFrames with the same plan (e.g. when a batch is loaded again), so
+            # unpersisting the previous batch can unpersist the new one as well
+            if persisted_by_engine and not (
+                batch_data.storageLevel.useMemory or batch_data.storageLevel.useDisk
+            ):
+                batch_data.persist(storage_level)
+        self._unpersist_compute_domains(batch_id=batch_id)
+        super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
+
+    def unpersist_all(self):
+        """Releases all batches and compute domains persisted by this engine.
+
+        Nothing calls this automatically: call it once the loaded batches are no longer being validated, since Spark
+        otherwise keeps them cached for as long as the session lives.
+        """
+        for batch_data in self.loaded_batch_data_dict.values():
+            if getattr(batch_data, "_persisted_by_engine", False):
+                batch_data.unpersist()
+                batch_data._persisted_by_engine = False
+        self._unpersist_compute_domains()
+
+    def _unpersist_compute_domains(self, batch_id: Optional[str] = None):
+        for key in list(self._compute_domain_cache.keys()):
+            if batch_id is None or key[0] == batch_id:
+                self._compute_domain_cache.pop(key).unpersist()
+
     def get_batch_data_and_markers(
         self, batch_spec: BatchSpec
     ) -> Tuple[Any, BatchMarkers]:  # batch_data
         batch_data: DataFrame
 
         # We need to build a batch_markers to be used in the dataframe
-        batch_markers: BatchMarkers = BatchMarkers(
-            {
-                "ge_load_time": datetime.datetime.now(datetime.timezone.utc).strftime(
-                    "%Y%m%dT%H%M%S.%fZ"
-                )
-            }
-        )
+        batch_markers: BatchMarkers = _now_marker()
 
         if isinstance(batch_spec, RuntimeDataBatchSpec):
             batch_data = batch_spec.batch_data
@@ -227,7 +441,13 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
             )
 
         batch_data = self._apply_splitting_and_sampling_methods(batch_spec, batch_data)
-        typed_batch_data = SparkDFBatchData(batch_data)
+        # Persisting is opt-in, since it materializes the whole batch before any metric is computed
+        persist: bool = self._persist and batch_spec.get("cache_level") is not None
+        if persist:
+            batch_data = self._persist_batch_data(
+                batch_data, cache_level=batch_spec.get("cache_level")
+            )
+        typed_batch_data = SparkDFBatchData(batch_data, persisted_by_engine=persist)
 
         return typed_batch_data, batch_markers
 
@@ -243,6 +463,30 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
             batch_data = sampling_fn(batch_data, **sampling_kwargs)
         return batch_data
 
+    @staticmethod
+    def _persist_batch_data(batch_data, cache_level: Optional[str] = None):
+        """Persists the batch and materializes it right away, since persist() on its own is lazy.
+
+        Args:
+            batch_data - the DataFrame to persist
+            cache_level - "disk" to keep the batch on disk only (e.g. for batches that do not fit in executor memory),
+            "memory" to prefer deserialized in-memory storage; defaults to memory and disk
+
+        Returns:
+            The persisted DataFrame
+        """
+        if cache_level == "disk":
+            storage_level = StorageLevel.DISK_ONLY
+        elif cache_level == "memory":
+            storage_level = getattr(
+                StorageLevel, "MEMORY_AND_DISK_DESER", StorageLevel.MEMORY_AND_DISK
+            )
+        else:
+            storage_level = StorageLevel.MEMORY_AND_DISK
+        batch_data = batch_data.persist(storage_level)
+        batch_data.count()
+        return batch_data
+
     @staticmethod
     def guess_reader_method_from_path(path):
         """Based on a given filepath, decides a reader method. Currently supports tsv, csv, and parquet. If none of these
@@ -286,9 +530,12 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
             reader_method = self.guess_reader_method_from_path(path=path)
 
         reader_method_op: str = reader_method.lower()
+        reader_fn_factory: Optional[Callable] = self.reader_fn_factories.get(
+            reader_method_op
+        )
+        if reader_fn_factory is not None:
+            return reader_fn_factory(reader)
         try:
-            if reader_method_op == "delta":
-                return reader.format(reader_method_op).load
             return getattr(reader, reader_method_op)
         except AttributeError:
             raise BatchKwargsError(
@@ -340,7 +587,8 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
             else:
                 raise ValidationError(f"Unable to find batch with batch_id {batch_id}")
 
-        compute_domain_kwargs = copy.deepcopy(domain_kwargs)
+        # Only top-level keys are moved between the kwargs dicts below, so a shallow copy suffices
+        compute_domain_kwargs = copy.copy(domain_kwargs)
         accessor_domain_kwargs = dict()
         table = domain_kwargs.get("table", None)
         if table:
@@ -351,15 +599,34 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
         row_condition = domain_kwargs.get("row_condition", None)
         if row_condition:
             condition_parser = domain_kwargs.get("condition_parser", None)
-            if condition_parser == "spark":
-                data = data.filter(row_condition)
-            elif condition_parser == "great_expectations__experimental__":
-                parsed_condition = parse_condition_to_spark(row_condition)
-                data = data.filter(parsed_condition)
+            cache_key = (
+                batch_id or self.active_batch_data_id,
+                condition_parser,
+                row_condition,
+            )
+            if cache_key in self._compute_domain_cache:
+                self._compute_domain_cache.move_to_end(cache_key)
+                data = self._compute_domain_cache[cache_key]
             else:
-                raise GreatExpectationsError(
-                    f"unrecognized condition_parser {str(condition_parser)}for Spark execution engine"
-                )
+                if condition_parser == "spark":
+                    data = data.filter(row_condition)
+                elif condition_parser == "great_expectations__experimental__":
+                    parsed_condition = self._parsed_row_conditions.get(row_condition)
+                    if parsed_condition is None:
+                        parsed_condition = parse_condition_to_spark(row_condition)
+                        self._parsed_row_conditions[row_condition] = parsed_condition
+                    data = data.filter(parsed_condition)
+                else:
+                    raise GreatExpectationsError(
+                        f"unrecognized condition_parser {str(condition_parser)}for Spark execution engine"
+                    )
+                if self._persist:
+                    # Metrics sharing a row condition reuse the filtered data instead of rescanning the batch
+                    data = data.persist(StorageLevel.MEMORY_AND_DISK)
+                    self._compute_domain_cache[cache_key] = data
+                    if len(self._compute_domain_cache) > COMPUTE_DOMAIN_CACHE_SIZE:
+                        _, evicted_data = self._compute_domain_cache.popitem(last=False)
+                        evicted_data.unpersist()
 
         # Warning user if accessor keys are in any domain that is not of type table, will be ignored
         if (
@@ -518,20 +785,26 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
                 }
             aggregates[domain_id]["column_aggregates"].append(engine_fn)
             aggregates[domain_id]["ids"].append(metric_to_resolve.id)
+        aggregate_dfs = []
         for aggregate in aggregates.values():
             compute_domain_kwargs = aggregate["domain_kwargs"]
             df, _, _ = self.get_compute_domain(
                 compute_domain_kwargs, domain_type="identity"
             )
             assert len(aggregate["column_aggregates"]) == len(aggregate["ids"])
-            condition_ids = []
-            aggregate_cols = []
-            for idx in range(len(aggregate["column_aggregates"])):
-                column_aggregate = aggregate["column_aggregates"][idx]
-                aggregate_id = str(uuid.uuid4())
-                condition_ids.append(aggregate_id)
-                aggregate_cols.append(column_aggregate)
-            res = df.agg(*aggregate_cols).collect()
+            aggregate_dfs.append(df.agg(*aggregate["column_aggregates"]))
+
+        # The aggregations over different domains are independent Spark jobs, so they are submitted concurrently
+        if len(aggregate_dfs) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(len(aggregate_dfs), MAX_CONCURRENT_BUNDLE_JOBS)
+            ) as executor:
+                collected_rows = list(executor.map(self._collect_rows, aggregate_dfs))
+        else:
+            collected_rows = [self._collect_rows(df) for df in aggregate_dfs]
+
+        for aggregate, res in zip(aggregates.values(), collected_rows):
+            compute_domain_kwargs = aggregate["domain_kwargs"]
             assert (
                 len(res) == 1
             ), "all bundle-computed metrics must be single-value statistics"
@@ -546,9 +819,40 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
 
         return resolved_metrics
 
+    @staticmethod
+    def _collect_rows(df) -> list:
+        """Collects the rows of a (small) DataFrame as sequences of python values.
+
+        When pyarrow is available and every column has a simple type, the rows are transferred as Arrow record batches
+        instead of being serialized cell by cell; otherwise the DataFrame is collected as Rows. The Arrow transfer
+        relies on the private DataFrame._collect_as_arrow, so it is only used by the pyspark versions known to have it.
+        """
+        if (
+            not ARROW_COLLECT_SUPPORTED
+            or importlib.util.find_spec("pyarrow") is None
+            or not all(
+                isinstance(field.dataType, ARROW_COLLECTABLE_TYPES)
+                for field in df.schema.fields
+            )
+        ):
+            return df.collect()
+
+        import pyarrow as pa
+
+        record_batches = df._collect_as_arrow()
+        if len(record_batches) == 0:
+            return []
+        table = pa.Table.from_batches(record_batches)
+        columns = [table.column(idx).to_pylist() for idx in range(table.num_columns)]
+        return list(zip(*columns))
+
     def head(self, n=5):
-        """Returns dataframe head. Default is 5"""
-        return self.dataframe.limit(n).toPandas()
+        """Returns dataframe head. Default is 5
+
+        The rows are transferred to pandas through Arrow when it is available.
+        """
+        with self._arrow_transfer():
+            return self.dataframe.limit(n).toPandas()
 
     @staticmethod
     def _split_on_whole_table(df,):
@@ -567,30 +871,39 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
         partition_definition: dict,
         date_format_string: str = "yyyy-MM-dd",
     ):
+        """Convert the values in the named column (seconds since epoch) to the given date_format, and split on that
+
+        For formats that name a contiguous time range (e.g. "yyyy-MM-dd"), the rows are selected with a range predicate on
+        the raw column, so no value needs to be formatted.
+        """
         matching_string = partition_definition[column_name]
-        res = (
-            df.withColumn(
-                "date_time_tmp", F.from_unixtime(F.col(column_name), date_format_string)
+        range_end_fn = CONTIGUOUS_DATETIME_FORMAT_RANGE_ENDS.get(date_format_string)
+        if range_end_fn is None:
+            return df.filter(
+                F.from_unixtime(F.col(column_name), date_format_string)
+                == matching_string
             )
-            .filter(F.col("date_time_tmp") == matching_string)
-            .drop("date_time_tmp")
+
+        # The bounds only involve literals, so Spark evaluates them once (in the session time zone) while planning
+        range_start = F.unix_timestamp(F.lit(matching_string), date_format_string)
+        range_end = range_end_fn(
+            range_start, F.to_date(F.lit(matching_string), date_format_string)
+        )
+        return df.filter(
+            (F.col(column_name) >= range_start) & (F.col(column_name) < range_end)
         )
-        return res
 
     @staticmethod
     def _split_on_divided_integer(
         df, column_name: str, divisor: int, partition_definition: dict,
     ):
         """Divide the values in the named column by `divisor`, and split on that"""
+        _check_integer_argument("divisor", divisor)
         matching_divisor = partition_definition[column_name]
-        res = (
-            df.withColumn(
-                "div_temp", (F.col(column_name) / divisor).cast(IntegerType())
-            )
-            .filter(F.col("div_temp") == matching_divisor)
-            .drop("div_temp")
+        # Rounded towards zero, like PandasExecutionEngine's int(x / divisor)
+        return df.filter(
+            (F.col(column_name) / divisor).cast(LongType()) == matching_divisor
         )
-        return res
 
     @staticmethod
     def _split_on_mod_integer(
@@ -598,18 +911,14 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
     ):
         """Divide the values in the named column by `divisor`, and split on that"""
         matching_mod_value = partition_definition[column_name]
-        res = (
-            df.withColumn("mod_temp", (F.col(column_name) % mod).cast(IntegerType()))
-            .filter(F.col("mod_temp") == matching_mod_value)
-            .drop("mod_temp")
-        )
-        return res
+        return df.filter(_positive_mod(F.col(column_name), mod) == matching_mod_value)
 
     @staticmethod
     def _split_on_multi_column_values(
         df, column_names: list, partition_definition: dict,
     ):
         """Split on the joint values in the named columns"""
+        conditions = []
         for column_name in column_names:
             value = partition_definition.get(column_name)
             if not value:
@@ -618,8 +927,10 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
                     f"all values in  column_names must also exist in partition_definition. "
                     f"{column_name} was not found in partition_definition."
                 )
-            df = df.filter(F.col(column_name) == value)
-        return df
+            conditions.append(F.col(column_name) == value)
+        if not conditions:
+            return df
+        return df.filter(reduce(and_, conditions))
 
     @staticmethod
     def _split_on_hashed_column(
@@ -640,48 +951,72 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
                 )
             )
 
-        def _encrypt_value(to_encode):
-            hash_func = getattr(hashlib, hash_function_name)
-            hashed_value = hash_func(to_encode.encode()).hexdigest()[-1 * hash_digits :]
-            return hashed_value
+        hash_expression = SparkDFExecutionEngine._native_hash_expression(
+            column_name=column_name,
+            hash_digits=hash_digits,
+            hash_function_name=hash_function_name,
+        )
+        if hash_expression is not None:
+            return df.filter(hash_expression == partition_definition["hash_value"])
 
-        encrypt_udf = F.udf(_encrypt_value, StringType())
-        res = (
-            df.withColumn("encrypted_value", encrypt_udf(column_name))
-            .filter(F.col("encrypted_value") == partition_definition["hash_value"])
-            .drop("encrypted_value")
+        encrypt_udf = _get_hash_udf(
+            hash_function_name=hash_function_name, hash_digits=hash_digits
+        )
+        return df.filter(
+            encrypt_udf(F.col(column_name)) == partition_definition["hash_value"]
         )
-        return res
+
+    @staticmethod
+    def _native_hash_expression(
+        column_name: str, hash_digits: int, hash_function_name: str,
+    ):
+        """Build the trailing `hash_digits` hex characters of the hashed column as a native Spark expression.
+
+        Values are hashed as Spark casts them to strings, which differs from python's str() for non-string columns
+        (e.g. booleans hash "true" rather than "True"); null values hash to null, and so never match a hash_value.
+
+        Returns None if the hash function has no native Spark SQL counterpart.
+        """
+        hash_fn = SPARK_NATIVE_HASH_FUNCTIONS.get(hash_function_name)
+        if hash_fn is None:
+            return None
+        hashed_column = hash_fn(F.col(column_name).cast(StringType()))
+        return F.substring(hashed_column, -1 * hash_digits, hash_digits)
 
     ### Sampling methods ###
     @staticmethod
     def _sample_using_random(df, p: float = 0.1, seed: int = 1):
         """Take a random sample of rows, retaining proportion p
         """
-        res = (
-            df.withColumn("rand", F.rand(seed=seed))
-            .filter(F.col("rand") < p)
-            .drop("rand")
-        )
-        return res
+        return df.sample(withReplacement=False, fraction=p, seed=seed)
 
     @staticmethod
     def _sample_using_mod(
         df, column_name: str, mod: int, value: int,
     ):
         """Take the mod of named column, and only keep rows that match the given value"""
-        res = (
-            df.withColumn("mod_temp", (F.col(column_name) % mod).cast(IntegerType()))
-            .filter(F.col("mod_temp") == value)
-            .drop("mod_temp")
-        )
-        return res
+        return df.filter(_positive_mod(F.col(column_name), mod) == value)
 
     @staticmethod
     def _sample_using_a_list(
         df, column_name: str, value_list: list,
     ):
-        """Match the values in the named column against value_list, and only keep the matches"""
+        """Match the values in the named column against value_list, and only keep the matches
+
+        Long lists of values of a single type are matched with a broadcast semi join, which keeps the list out of the
+        query plan itself.
+        """
+        if len(value_list) > SAMPLE_USING_A_LIST_BROADCAST_THRESHOLD and (
+            len({type(value) for value in value_list}) == 1
+        ):
+            values_df = df.sql_ctx.sparkSession.createDataFrame(
+                [(value,) for value in value_list], ["value"]
+            )
+            return df.join(
+                F.broadcast(values_df),
+                on=df[column_name] == values_df["value"],
+                how="left_semi",
+            )
         return df.where(F.col(column_name).isin(value_list))
 
     @staticmethod
@@ -702,18 +1037,15 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
                 )
             )
 
-        def _encrypt_value(to_encode):
-            to_encode_str = str(to_encode)
-            hash_func = getattr(hashlib, hash_function_name)
-            hashed_value = hash_func(to_encode_str.encode()).hexdigest()[
-                -1 * hash_digits :
-            ]
-            return hashed_value
-
-        encrypt_udf = F.udf(_encrypt_value, StringType())
-        res = (
-            df.withColumn("encrypted_value", encrypt_udf(column_name))
-            .filter(F.col("encrypted_value") == hash_value)
-            .drop("encrypted_value")
+        hash_expression = SparkDFExecutionEngine._native_hash_expression(
+            column_name=column_name,
+            hash_digits=hash_digits,
+            hash_function_name=hash_function_name,
+        )
+        if hash_expression is not None:
+            return df.filter(hash_expression == hash_value)
+
+        encrypt_udf = _get_hash_udf(
+            hash_function_name=hash_function_name, hash_digits=hash_digits
         )
-        return res
+        return df.filter(encrypt_udf(F.col(column_name)) == hash_value)
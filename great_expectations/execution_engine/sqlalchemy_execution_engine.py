@@ -212,12 +212,10 @@ class SqlAlchemyBatchData(object):
                         "schema_name should not be used when passing a table_name for biquery. Instead, include the schema name in the table_name string."
                     )
                 # In BigQuery the table name is already qualified with its schema name
-                self._selectable = sa.Table(
-                    table_name, sa.MetaData(), schema_name=None,
-                )
+                self._selectable = sa.Table(table_name, sa.MetaData(), schema=None,)
             else:
                 self._selectable = sa.Table(
-                    table_name, sa.MetaData(), schema_name=schema_name,
+                    table_name, sa.MetaData(), schema=schema_name,
                 )
 
         elif create_temp_table:
@@ -246,7 +244,7 @@ class SqlAlchemyBatchData(object):
                 temp_table_schema_name=temp_table_schema_name,
             )
             self._selectable = sa.Table(
-                generated_table_name, sa.MetaData(), schema_name=temp_table_schema_name,
+                generated_table_name, sa.MetaData(), schema=temp_table_schema_name,
             )
         else:
             if query:
@@ -93,6 +93,8 @@ class ExpectColumnDistinctValuesToBeInSet(ColumnExpectation):
 
             """
 
+    __slots__ = ()
+
     # Setting necessary computation metric dependencies and defining kwargs, as well as assigning kwargs default values\
     metric_dependencies = ("column.value_counts",)
     success_keys = (
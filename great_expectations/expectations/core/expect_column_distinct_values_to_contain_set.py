@@ -26,6 +26,8 @@ from ..registry import extract_metrics
 
 
 class ExpectColumnDistinctValuesToContainSet(ColumnExpectation):
+    __slots__ = ()
+
     # Setting necessary computation metric dependencies and defining kwargs, as well as assigning kwargs default values\
     metric_dependencies = ("column.value_counts",)
     success_keys = (
@@ -14,6 +14,8 @@ from ..metrics.util import parse_value_set
 
 
 class ExpectColumnDistinctValuesToEqualSet(ColumnExpectation):
+    __slots__ = ()
+
     # Setting necessary computation metric dependencies and defining kwargs, as well as assigning kwargs default values\
     metric_dependencies = ("column.value_counts",)
     success_keys = (
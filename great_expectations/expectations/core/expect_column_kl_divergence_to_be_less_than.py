@@ -158,6 +158,8 @@ class ExpectColumnKlDivergenceToBeLessThan(TableExpectation):
 
             """
 
+    __slots__ = ()
+
     success_keys = (
         "partition_object",
         "threshold",
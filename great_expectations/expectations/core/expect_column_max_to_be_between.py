@@ -91,6 +91,8 @@ class ExpectColumnMaxToBeBetween(ColumnExpectation):
 
            """
 
+    __slots__ = ()
+
     # Setting necessary computation metric dependencies and defining kwargs, as well as assigning kwargs default values\
     metric_dependencies = ("column.max",)
     success_keys = ("min_value", "strict_min", "max_value", "strict_max")
@@ -74,6 +74,8 @@ class ExpectColumnMeanToBeBetween(ColumnExpectation):
 
             """
 
+    __slots__ = ()
+
     # Setting necessary computation metric dependencies and defining kwargs, as well as assigning kwargs default values\
     metric_dependencies = ("column.mean",)
     success_keys = ("min_value", "strict_min", "max_value", "strict_max")
@@ -85,6 +85,8 @@ class ExpectColumnMedianToBeBetween(ColumnExpectation):
 
             """
 
+    __slots__ = ()
+
     # Setting necessary computation metric dependencies and defining kwargs, as well as assigning kwargs default values\
     metric_dependencies = ("column.median",)
     success_keys = ("min_value", "strict_min", "max_value", "strict_max")
@@ -197,17 +199,7 @@ class ExpectColumnMedianToBeBetween(ColumnExpectation):
         )
 
         # Runtime configuration has preference
-        if runtime_configuration:
-            result_format = runtime_configuration.get(
-                "result_format",
-                configuration.kwargs.get(
-                    "result_format", self.default_kwarg_values.get("result_format")
-                ),
-            )
-        else:
-            result_format = configuration.kwargs.get(
-                "result_format", self.default_kwarg_values.get("result_format")
-            )
+        result_format = self.get_result_format(configuration, runtime_configuration)
 
         column_median = metric_vals.get("column.median")
 
@@ -86,6 +86,8 @@ class ExpectColumnMinToBeBetween(ColumnExpectation):
 
             """
 
+    __slots__ = ()
+
     # Setting necessary computation metric dependencies and defining kwargs, as well as assigning kwargs default values\
     metric_dependencies = ("column.min",)
     success_keys = ("min_value", "strict_min", "max_value", "strict_max")
@@ -76,6 +76,8 @@ class ExpectColumnMostCommonValueToBeInSet(ColumnExpectation):
 
             """
 
+    __slots__ = ()
+
     # Setting necessary computation metric dependencies and defining kwargs, as well as assigning kwargs default values\
     metric_dependencies = ("column.most_common_value",)
     success_keys = (
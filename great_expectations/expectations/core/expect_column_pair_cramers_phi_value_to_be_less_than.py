@@ -8,6 +8,8 @@ from great_expectations.render.util import num_to_str, substitute_none_for_missi
 
 
 class ExpectColumnPairCramersPhiValueToBeLessThan(TableExpectation):
+    __slots__ = ()
+
     metric_dependencies = tuple()
     success_keys = (
         "column_A",
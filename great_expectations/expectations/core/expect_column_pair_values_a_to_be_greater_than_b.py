@@ -72,6 +72,8 @@ class ExpectColumnPairValuesAToBeGreaterThanB(TableExpectation):
 
     """
 
+    __slots__ = ()
+
     metric_dependencies = ("column_a_greater_than_b",)
     success_keys = (
         "column_A",
@@ -261,16 +263,6 @@ class ExpectColumnPairValuesAToBeGreaterThanB(TableExpectation):
         )
         equal_columns = metric_vals["column_a_greater_than_b"]
 
-        if runtime_configuration:
-            result_format = runtime_configuration.get(
-                "result_format",
-                configuration.kwargs.get(
-                    "result_format", self.default_kwarg_values.get("result_format")
-                ),
-            )
-        else:
-            result_format = configuration.kwargs.get(
-                "result_format", self.default_kwarg_values.get("result_format")
-            )
+        result_format = self.get_result_format(configuration, runtime_configuration)
 
         return {"success": equal_columns.all()}
@@ -66,6 +66,8 @@ class ExpectColumnPairValuesToBeEqual(TableExpectation):
 
     """
 
+    __slots__ = ()
+
     metric_dependencies = ("equal_columns",)
     success_keys = (
         "column_A",
@@ -209,16 +211,6 @@ class ExpectColumnPairValuesToBeEqual(TableExpectation):
         )
         equal_columns = metric_vals["equal_columns"]
 
-        if runtime_configuration:
-            result_format = runtime_configuration.get(
-                "result_format",
-                configuration.kwargs.get(
-                    "result_format", self.default_kwarg_values.get("result_format")
-                ),
-            )
-        else:
-            result_format = configuration.kwargs.get(
-                "result_format", self.default_kwarg_values.get("result_format")
-            )
+        result_format = self.get_result_format(configuration, runtime_configuration)
 
         return {"success": equal_columns}
@@ -69,6 +69,8 @@ class ExpectColumnPairValuesToBeInSet(ColumnPairMapExpectation):
 
     """
 
+    __slots__ = ()
+
     map_metric = ("column_pair_values.in_set",)
     domain_keys = (
         "batch_id",
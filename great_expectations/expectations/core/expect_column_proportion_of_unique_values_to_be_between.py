@@ -87,6 +87,8 @@ class ExpectColumnProportionOfUniqueValuesToBeBetween(ColumnExpectation):
 
     """
 
+    __slots__ = ()
+
     # Setting necessary computation metric dependencies and defining kwargs, as well as assigning kwargs default values\
     metric_dependencies = ("column.unique_proportion",)
     success_keys = ("min_value", "strict_min", "max_value", "strict_max")
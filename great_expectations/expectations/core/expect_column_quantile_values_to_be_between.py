@@ -116,6 +116,8 @@ class ExpectColumnQuantileValuesToBeBetween(TableExpectation):
 
            """
 
+    __slots__ = ()
+
     metric_dependencies = ("column.quantiles",)
     success_keys = (
         "quantile_ranges",
@@ -381,17 +383,7 @@ class ExpectColumnQuantileValuesToBeBetween(TableExpectation):
         )
 
         # Runtime configuration has preference
-        if runtime_configuration:
-            result_format = runtime_configuration.get(
-                "result_format",
-                configuration.kwargs.get(
-                    "result_format", self.default_kwarg_values.get("result_format")
-                ),
-            )
-        else:
-            result_format = configuration.kwargs.get(
-                "result_format", self.default_kwarg_values.get("result_format")
-            )
+        result_format = self.get_result_format(configuration, runtime_configuration)
 
         quantile_vals = metric_vals.get("column.quantiles")
         quantile_ranges = self.get_success_kwargs(configuration).get("quantile_ranges")
@@ -83,6 +83,8 @@ class ExpectColumnStdevToBeBetween(ColumnExpectation):
 
             """
 
+    __slots__ = ()
+
     metric_dependencies = ("column.standard_deviation",)
     success_keys = (
         "min_value",
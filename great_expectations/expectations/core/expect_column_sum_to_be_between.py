@@ -79,6 +79,8 @@ class ExpectColumnSumToBeBetween(ColumnExpectation):
 
            """
 
+    __slots__ = ()
+
     # Setting necessary computation metric dependencies and defining kwargs, as well as assigning kwargs default values\
     metric_dependencies = ("column.sum",)
     success_keys = ("min_value", "strict_min", "max_value", "strict_max")
@@ -57,6 +57,8 @@ class ExpectColumnToExist(TableExpectation):
 
     """
 
+    __slots__ = ()
+
     metric_dependencies = ("table.columns",)
     success_keys = (
         "column",
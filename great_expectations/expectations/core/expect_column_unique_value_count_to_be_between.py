@@ -80,6 +80,8 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnExpectation):
 
             """
 
+    __slots__ = ()
+
     # Setting necessary computation metric dependencies and defining kwargs, as well as assigning kwargs default values\
     metric_dependencies = ("column.distinct_values.count",)
     success_keys = (
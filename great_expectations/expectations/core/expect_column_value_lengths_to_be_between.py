@@ -87,6 +87,8 @@ class ExpectColumnValueLengthsToBeBetween(ColumnMapExpectation):
 
     """
 
+    __slots__ = ()
+
     map_metric = "column_values.value_length.between"
     success_keys = (
         "min_value",
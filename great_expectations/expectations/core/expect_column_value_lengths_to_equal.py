@@ -81,6 +81,8 @@ class ExpectColumnValueLengthsToEqual(ColumnMapExpectation):
 
     """
 
+    __slots__ = ()
+
     map_metric = "column_values.value_length.equals"
     success_keys = ("value", "mostly", "parse_strings_as_datetimes")
 
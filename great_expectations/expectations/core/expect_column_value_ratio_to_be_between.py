@@ -64,6 +64,8 @@ class ExpectColumnValueRatioToBeBetween(TableExpectation):
                    :ref:`include_config`, :ref:`catch_exceptions`, and :ref:`meta`.
        """
 
+    __slots__ = ()
+
     # Setting necessary computation metric dependencies and defining kwargs, as well as assigning kwargs default values\
     metric_dependencies = ("column.value_ratio",)
     success_keys = ("value", "min_value", "strict_min", "max_value", "strict_max")
@@ -195,17 +197,7 @@ class ExpectColumnValueRatioToBeBetween(TableExpectation):
         )
 
         # Runtime configuration has preference
-        if runtime_configuration:
-            result_format = runtime_configuration.get(
-                "result_format",
-                configuration.kwargs.get(
-                    "result_format", self.default_kwarg_values.get("result_format")
-                ),
-            )
-        else:
-            result_format = configuration.kwargs.get(
-                "result_format", self.default_kwarg_values.get("result_format")
-            )
+        result_format = self.get_result_format(configuration, runtime_configuration)
 
         value_ratio = metric_vals.get("column.value_ratio")
 
@@ -85,6 +85,8 @@ class ExpectColumnValuesToBeBetween(ColumnMapExpectation):
 
     """
 
+    __slots__ = ()
+
     map_metric = "column_values.between"
     success_keys = (
         "min_value",
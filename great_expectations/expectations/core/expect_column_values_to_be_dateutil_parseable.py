@@ -75,6 +75,8 @@ class ExpectColumnValuesToBeDateutilParseable(ColumnMapExpectation):
 
     """
 
+    __slots__ = ()
+
     map_metric = "column_values.dateutil_parsable"
     success_keys = ("mostly",)
 
@@ -70,6 +70,8 @@ class ExpectColumnValuesToBeDecreasing(ColumnMapExpectation):
 
     """
 
+    __slots__ = ()
+
     map_metric = "column_values.decreasing"
     success_keys = (
         "strictly",
@@ -88,6 +88,8 @@ class ExpectColumnValuesToBeInSet(ColumnMapExpectation):
 
     """
 
+    __slots__ = ()
+
     map_metric = "column_values.in_set"
     success_keys = (
         "value_set",
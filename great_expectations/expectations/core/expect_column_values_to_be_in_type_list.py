@@ -16,7 +16,10 @@ from great_expectations.expectations.core.expect_column_values_to_be_of_type imp
     _get_dialect_type_module,
     _native_type_type_map,
 )
-from great_expectations.expectations.expectation import ColumnMapExpectation
+from great_expectations.expectations.expectation import (
+    ColumnMapExpectation,
+    TableExpectation,
+)
 from great_expectations.expectations.registry import get_metric_kwargs
 from great_expectations.render.renderer.renderer import renderer
 from great_expectations.render.types import RenderedStringTemplateContent
@@ -90,6 +93,8 @@ class ExpectColumnValuesToBeInTypeList(ColumnMapExpectation):
         <great_expectations.dataset.dataset.Dataset.expect_column_values_to_be_of_type>`
     """
 
+    __slots__ = ()
+
     map_metric = "column_values.in_type_list"
 
     success_keys = (
@@ -302,8 +307,8 @@ class ExpectColumnValuesToBeInTypeList(ColumnMapExpectation):
     ):
         # this calls TableExpectation.get_validation_dependencies to set baseline dependencies
         # for the aggregate version of the expectation
-        dependencies = super(ColumnMapExpectation, self).get_validation_dependencies(
-            configuration, execution_engine, runtime_configuration
+        dependencies = TableExpectation.get_validation_dependencies(
+            self, configuration, execution_engine, runtime_configuration
         )
 
         # only PandasExecutionEngine supports the column map version of the expectation
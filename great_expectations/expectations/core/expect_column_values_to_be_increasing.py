@@ -68,6 +68,8 @@ class ExpectColumnValuesToBeIncreasing(ColumnMapExpectation):
 
     """
 
+    __slots__ = ()
+
     map_metric = "column_values.increasing"
     success_keys = ("strictly", "mostly", "parse_strings_as_datetimes")
     default_kwarg_values = {
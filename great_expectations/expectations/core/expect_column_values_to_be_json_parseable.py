@@ -79,6 +79,8 @@ class ExpectColumnValuesToBeJsonParseable(ColumnMapExpectation):
 
     """
 
+    __slots__ = ()
+
     map_metric = "column_values.json_parsable"
     success_keys = ("mostly",)
 
@@ -59,6 +59,8 @@ class ExpectColumnValuesToBeNull(ColumnMapExpectation):
 
     """
 
+    __slots__ = ()
+
     map_metric = "column_values.null"
 
     @classmethod
@@ -159,17 +161,7 @@ class ExpectColumnValuesToBeNull(ColumnMapExpectation):
         runtime_configuration: dict = None,
         execution_engine: ExecutionEngine = None,
     ):
-        if runtime_configuration:
-            result_format = runtime_configuration.get(
-                "result_format",
-                configuration.kwargs.get(
-                    "result_format", self.default_kwarg_values.get("result_format")
-                ),
-            )
-        else:
-            result_format = configuration.kwargs.get(
-                "result_format", self.default_kwarg_values.get("result_format")
-            )
+        result_format = self.get_result_format(configuration, runtime_configuration)
         mostly = self.get_success_kwargs().get(
             "mostly", self.default_kwarg_values.get("mostly")
         )
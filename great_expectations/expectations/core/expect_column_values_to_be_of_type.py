@@ -132,6 +132,8 @@ class ExpectColumnValuesToBeOfType(ColumnMapExpectation):
 
     """
 
+    __slots__ = ()
+
     map_metric = "column_values.of_type"
     success_keys = (
         "type_",
@@ -307,8 +309,8 @@ class ExpectColumnValuesToBeOfType(ColumnMapExpectation):
     ):
         # this calls TableExpectation.get_validation_dependencies to set baseline dependencies
         # for the aggregate version of the expectation
-        dependencies = super(ColumnMapExpectation, self).get_validation_dependencies(
-            configuration, execution_engine, runtime_configuration
+        dependencies = TableExpectation.get_validation_dependencies(
+            self, configuration, execution_engine, runtime_configuration
         )
 
         # only PandasExecutionEngine supports the column map version of the expectation
@@ -76,6 +76,8 @@ class ExpectColumnValuesToBeUnique(ColumnMapExpectation):
         :ref:`include_config`, :ref:`catch_exceptions`, and :ref:`meta`.
     """
 
+    __slots__ = ()
+
     map_metric = "column_values.unique"
     success_keys = ("mostly",)
 
@@ -89,22 +91,6 @@ class ExpectColumnValuesToBeUnique(ColumnMapExpectation):
         "catch_exceptions": True,
     }
 
-    def validate_configuration(self, configuration: Optional[ExpectationConfiguration]):
-        super().validate_configuration(configuration)
-        try:
-            assert (
-                "column" in configuration.kwargs
-            ), "'column' parameter is required for column map expectations"
-            if "mostly" in configuration.kwargs:
-                mostly = configuration.kwargs["mostly"]
-                assert isinstance(
-                    mostly, (int, float)
-                ), "'mostly' parameter must be an integer or float"
-                assert 0 <= mostly <= 1, "'mostly' parameter must be between 0 and 1"
-        except AssertionError as e:
-            raise InvalidExpectationConfigurationError(str(e))
-        return True
-
     @classmethod
     @renderer(renderer_type="renderer.prescriptive")
     def _prescriptive_renderer(
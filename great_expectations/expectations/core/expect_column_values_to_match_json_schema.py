@@ -63,6 +63,8 @@ class ExpectColumnValuesToMatchJsonSchema(ColumnMapExpectation):
         The `JSON-schema docs <http://json-schema.org/>`_.
     """
 
+    __slots__ = ()
+
     map_metric = "column_values.match_json_schema"
     success_keys = (
         "json_schema",
@@ -85,6 +85,8 @@ class ExpectColumnValuesToMatchRegex(ColumnMapExpectation):
 
     """
 
+    __slots__ = ()
+
     map_metric = "column_values.match_regex"
     success_keys = (
         "regex",
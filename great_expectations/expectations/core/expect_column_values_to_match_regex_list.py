@@ -87,6 +87,8 @@ class ExpectColumnValuesToMatchRegexList(ColumnMapExpectation):
 
     """
 
+    __slots__ = ()
+
     map_metric = "column_values.match_regex_list"
     success_keys = (
         "regex_list",
@@ -75,6 +75,8 @@ class ExpectColumnValuesToMatchStrftimeFormat(ColumnMapExpectation):
 
     """
 
+    __slots__ = ()
+
     map_metric = "column_values.match_strftime_format"
     success_keys = (
         "strftime_format",
@@ -98,6 +98,8 @@ class ExpectColumnValuesToNotBeInSet(ColumnMapExpectation):
 
     """
 
+    __slots__ = ()
+
     map_metric = "column_values.not_in_set"
     success_keys = (
         "value_set",
@@ -84,6 +84,8 @@ class ExpectColumnValuesToNotMatchRegex(ColumnMapExpectation):
 
     """
 
+    __slots__ = ()
+
     map_metric = "column_values.not_match_regex"
     success_keys = (
         "regex",
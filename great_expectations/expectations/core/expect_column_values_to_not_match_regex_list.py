@@ -80,6 +80,8 @@ class ExpectColumnValuesToNotMatchRegexList(ColumnMapExpectation):
 
     """
 
+    __slots__ = ()
+
     map_metric = "column_values.not_match_regex_list"
     success_keys = (
         "regex_list",
@@ -9,6 +9,8 @@ from great_expectations.render.util import (
 
 
 class ExpectMulticolumnValuesToBeUnique(ColumnMapExpectation):
+    __slots__ = ()
+
     metric_dependencies = tuple()
     success_keys = (
         "column_list",
@@ -65,6 +65,8 @@ class ExpectTableColumnCountToBeBetween(TableExpectation):
         expect_table_column_count_to_equal
     """
 
+    __slots__ = ()
+
     metric_dependencies = ("table.column_count",)
     success_keys = (
         "min_value",
@@ -56,6 +56,8 @@ class ExpectTableColumnCountToEqual(TableExpectation):
         expect_table_column_count_to_be_between
     """
 
+    __slots__ = ()
+
     metric_dependencies = ("table.column_count",)
 
     success_keys = ("value",)
@@ -148,17 +150,7 @@ class ExpectTableColumnCountToEqual(TableExpectation):
         )
 
         # Runtime configuration has preference
-        if runtime_configuration:
-            result_format = runtime_configuration.get(
-                "result_format",
-                configuration.kwargs.get(
-                    "result_format", self.default_kwarg_values.get("result_format")
-                ),
-            )
-        else:
-            result_format = configuration.kwargs.get(
-                "result_format", self.default_kwarg_values.get("result_format")
-            )
+        result_format = self.get_result_format(configuration, runtime_configuration)
         column_count = metric_vals.get("columns.count")
 
         # Obtaining components needed for validation
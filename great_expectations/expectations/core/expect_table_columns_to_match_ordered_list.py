@@ -52,6 +52,8 @@ class ExpectTableColumnsToMatchOrderedList(TableExpectation):
 
     """
 
+    __slots__ = ()
+
     metric_dependencies = ("table.columns",)
     success_keys = ("column_list",)
     domain_keys = (
@@ -10,6 +10,8 @@ from great_expectations.render.util import substitute_none_for_missing
 
 
 class ExpectTableColumnsToMatchSet(TableExpectation):
+    __slots__ = ()
+
     metric_dependencies = ("table.columns",)
     success_keys = (
         "column_set",
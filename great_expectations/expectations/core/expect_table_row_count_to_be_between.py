@@ -68,6 +68,8 @@ class ExpectTableRowCountToBeBetween(TableExpectation):
         expect_table_row_count_to_equal
     """
 
+    __slots__ = ()
+
     metric_dependencies = ("table.row_count",)
 
     success_keys = (
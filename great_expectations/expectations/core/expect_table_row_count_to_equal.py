@@ -59,6 +59,8 @@ class ExpectTableRowCountToEqual(TableExpectation):
         expect_table_row_count_to_be_between
     """
 
+    __slots__ = ()
+
     metric_dependencies = ("table.row_count",)
 
     success_keys = ("value",)
@@ -9,6 +9,8 @@ from great_expectations.render.util import num_to_str, substitute_none_for_missi
 
 
 class ExpectTableRowCountToEqualOtherTable(TableExpectation):
+    __slots__ = ()
+
     metric_dependencies = ("table.row_count",)
     success_keys = ("other_table_name",)
     default_kwarg_values = {
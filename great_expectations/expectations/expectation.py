@@ -1,10 +1,12 @@
 import logging
-import re
+import string
 from abc import ABC, ABCMeta, abstractmethod
 from collections import Counter
-from copy import deepcopy
+from enum import IntEnum
+from functools import lru_cache
 from inspect import isabstract
-from typing import Any, Callable, Dict, Iterable, List, Optional, Type, Union
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
 
 from great_expectations import __version__ as ge_version
 from great_expectations.core.expectation_configuration import (
@@ -17,12 +19,11 @@ from great_expectations.core.expectation_validation_result import (
 from great_expectations.exceptions import (
     GreatExpectationsError,
     InvalidExpectationConfigurationError,
-    InvalidExpectationKwargsError,
 )
 from great_expectations.expectations.registry import (
-    get_metric_kwargs,
+    get_metric_kwargs_batch,
     register_expectation,
-    register_renderer,
+    register_renderers,
 )
 from great_expectations.expectations.util import legacy_method_parameters
 
@@ -41,13 +42,134 @@ from ..validator.validation_graph import MetricConfiguration
 logger = logging.getLogger(__name__)
 
 
-p1 = re.compile(r"(.)([A-Z][a-z]+)")
-p2 = re.compile(r"([a-z0-9])([A-Z])")
+_ASCII_LOWERCASE = frozenset(string.ascii_lowercase)
+_ASCII_LOWERCASE_OR_DIGITS = _ASCII_LOWERCASE | frozenset(string.digits)
+_ASCII_UPPERCASE = frozenset(string.ascii_uppercase)
 
 
+@lru_cache(maxsize=None)
 def camel_to_snake(name):
-    name = p1.sub(r"\1_\2", name)
-    return p2.sub(r"\1_\2", name).lower()
+    # Single pass equivalent of applying re.sub(r"(.)([A-Z][a-z]+)", r"\1_\2", ...) and then
+    # re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", ...): an uppercase letter (other than the first character) starts a
+    # new word when it follows a lowercase letter or digit, or when it is followed by a lowercase letter.
+    chars = []
+    last_index = len(name) - 1
+    for index, char in enumerate(name):
+        if (
+            index > 0
+            and char in _ASCII_UPPERCASE
+            and (
+                name[index - 1] in _ASCII_LOWERCASE_OR_DIGITS
+                or (index < last_index and name[index + 1] in _ASCII_LOWERCASE)
+            )
+        ):
+            chars.append("_")
+        chars.append(char)
+    return "".join(chars).lower()
+
+
+def _unexpected_value_label(value):
+    """Return the value to display for an unexpected value in the diagnostic unexpected table."""
+    if value is None:
+        return "null"
+    if value == "":
+        return "EMPTY"
+    return value
+
+
+# Static styling shared by the base renderers. The renderers only build the per-render parts (template and
+# params) afresh, since views rewrite those in place; styling is only ever read.
+_PRESCRIPTIVE_STYLING = {"parent": {"classes": ["alert", "alert-warning"]}}
+_PRESCRIPTIVE_TEMPLATE_STYLING = {
+    "params": {"expectation_type": {"classes": ["badge", "badge-warning"]}}
+}
+_STATUS_ICON_EXCEPTION_STYLING = {
+    "params": {
+        "icon": {
+            "classes": ["fas", "fa-exclamation-triangle", "text-warning"],
+            "tag": "i",
+        }
+    }
+}
+_STATUS_ICON_SUCCESS_STYLING = {
+    "params": {
+        "icon": {"classes": ["fas", "fa-check-circle", "text-success"], "tag": "i"}
+    }
+}
+_STATUS_ICON_SUCCESS_PARENT_STYLING = {
+    "parent": {"classes": ["hide-succeeded-validation-target-child"]}
+}
+_STATUS_ICON_FAILURE_STYLING = {
+    "params": {"icon": {"tag": "i", "classes": ["fas", "fa-times", "text-danger"]}}
+}
+
+
+def _status_icon_content(markdown_status_icon, icon_styling, styling=None):
+    return RenderedStringTemplateContent(
+        content_block_type="string_template",
+        string_template={
+            "template": "$icon",
+            "params": {"icon": "", "markdown_status_icon": markdown_status_icon},
+            "styling": icon_styling,
+        },
+        styling=styling,
+    )
+
+
+def _count_to_str(count):
+    """Format a row count for display with locale-specific grouping.
+
+    Plain ints small enough to survive num_to_str's float round trip are formatted directly with the locale-aware
+    "n" format, which yields the same string as num_to_str(count, use_locale=True, precision=20) without going
+    through Decimal.
+    """
+    if isinstance(count, int) and not isinstance(count, bool) and abs(count) < 2 ** 53:
+        return format(count, "n")
+    return num_to_str(count, use_locale=True, precision=20)
+
+
+def _exception_content_blocks(expectation_type, exception_info):
+    """Render the message and collapsible traceback for an expectation that raised an exception."""
+    exception_message = RenderedStringTemplateContent(
+        content_block_type="string_template",
+        string_template={
+            "template": "\n\n$expectation_type raised an exception:\n$exception_message",
+            "params": {
+                "expectation_type": expectation_type,
+                "exception_message": exception_info["exception_message"],
+            },
+            "tag": "strong",
+            "styling": {
+                "classes": ["text-danger"],
+                "params": {
+                    "exception_message": {"tag": "code"},
+                    "expectation_type": {"classes": ["badge", "badge-danger", "mb-2"]},
+                },
+            },
+        },
+    )
+    exception_traceback_collapse = CollapseContent(
+        collapse_toggle_link="Show exception traceback...",
+        collapse=[
+            RenderedStringTemplateContent(
+                content_block_type="string_template",
+                string_template={
+                    "template": exception_info["exception_traceback"],
+                    "tag": "code",
+                },
+            )
+        ],
+    )
+    return [exception_message, exception_traceback_collapse]
+
+
+class ResultFormatLevel(IntEnum):
+    """Ranking of the result_format levels; each level includes everything returned by the levels below it."""
+
+    BOOLEAN_ONLY = 0
+    BASIC = 1
+    SUMMARY = 2
+    COMPLETE = 3
 
 
 class MetaExpectation(ABCMeta):
@@ -59,18 +181,46 @@ class MetaExpectation(ABCMeta):
 
     def __new__(cls, clsname, bases, attrs):
         newclass = super().__new__(cls, clsname, bases, attrs)
-        if not isabstract(newclass):
-            newclass.expectation_type = camel_to_snake(clsname)
-            register_expectation(newclass)
-        newclass._register_renderer_functions()
-        default_kwarg_values = dict()
-        for base in reversed(bases):
-            default_kwargs = getattr(base, "default_kwarg_values", dict())
-            default_kwarg_values = nested_update(default_kwarg_values, default_kwargs)
-
-        newclass.default_kwarg_values = nested_update(
-            default_kwarg_values, attrs.get("default_kwarg_values", dict())
-        )
+        expectation_type = camel_to_snake(clsname)
+        # Underscore-prefixed classes are shared implementation details and are never registered
+        if not clsname.startswith("_"):
+            if not isabstract(newclass):
+                newclass.expectation_type = expectation_type
+                register_expectation(newclass)
+            newclass._register_renderer_functions(_expectation_type=expectation_type)
+        # Subclasses may declare their keys as lists or tuples
+        domain_keys = tuple(newclass.domain_keys)
+        success_keys = tuple(newclass.success_keys)
+        runtime_keys = tuple(newclass.runtime_keys)
+        newclass._kwargs_keys_by_tier = {
+            "domain": domain_keys,
+            "success": domain_keys + success_keys,
+            "runtime": domain_keys + success_keys + runtime_keys,
+        }
+        newclass._allowed_config_keys = newclass._kwargs_keys_by_tier["runtime"]
+
+        # Each Expectation base already holds the defaults merged across its own hierarchy, so only the direct
+        # bases and the class's own defaults need to be merged here.
+        bases_default_kwarg_values = [
+            base.default_kwarg_values
+            for base in reversed(bases)
+            if getattr(base, "default_kwarg_values", None)
+        ]
+        own_default_kwarg_values = attrs.get("default_kwarg_values")
+        if (
+            not own_default_kwarg_values
+            and len(bases_default_kwarg_values) == 1
+            and isinstance(bases_default_kwarg_values[0], MappingProxyType)
+        ):
+            # Most expectations inherit their defaults verbatim: share the parent's read-only mapping
+            newclass.default_kwarg_values = bases_default_kwarg_values[0]
+        else:
+            default_kwarg_values = dict()
+            for base_default_kwarg_values in bases_default_kwarg_values:
+                nested_update(default_kwarg_values, base_default_kwarg_values)
+            if own_default_kwarg_values:
+                nested_update(default_kwarg_values, own_default_kwarg_values)
+            newclass.default_kwarg_values = MappingProxyType(default_kwarg_values)
         return newclass
 
 
@@ -108,6 +258,9 @@ class Expectation(ABC, metaclass=MetaExpectation):
 
     """
 
+    # Subclasses that add no instance attributes of their own should declare empty __slots__ as well
+    __slots__ = ("_configuration",)
+
     version = ge_version
     domain_keys = tuple()
     success_keys = tuple()
@@ -129,16 +282,30 @@ class Expectation(ABC, metaclass=MetaExpectation):
         self._configuration = configuration
 
     @classmethod
-    def _register_renderer_functions(cls):
-        expectation_type = camel_to_snake(cls.__name__)
-
-        for candidate_renderer_fn_name in dir(cls):
-            attr_obj = getattr(cls, candidate_renderer_fn_name)
-            if not hasattr(attr_obj, "_renderer_type"):
-                continue
-            register_renderer(
-                object_name=expectation_type, parent_class=cls, renderer_fn=attr_obj
-            )
+    def _register_renderer_functions(cls, _expectation_type: Optional[str] = None):
+        expectation_type = _expectation_type or camel_to_snake(cls.__name__)
+
+        # Inspect the raw class dicts rather than dir()/getattr so that only actual renderers
+        # are bound; names are registered in sorted order, as dir() would have listed them.
+        renderer_fn_names = set()
+        seen_names = set()
+        for klass in cls.__mro__:
+            for candidate_renderer_fn_name, raw_attr in vars(klass).items():
+                if candidate_renderer_fn_name in seen_names:
+                    continue
+                seen_names.add(candidate_renderer_fn_name)
+                fn = getattr(raw_attr, "__func__", raw_attr)
+                if hasattr(fn, "_renderer_type"):
+                    renderer_fn_names.add(candidate_renderer_fn_name)
+
+        register_renderers(
+            object_name=expectation_type,
+            parent_class=cls,
+            renderer_fns=[
+                getattr(cls, renderer_fn_name)
+                for renderer_fn_name in sorted(renderer_fn_names)
+            ],
+        )
 
     @abstractmethod
     def get_validation_dependencies(
@@ -171,24 +338,16 @@ class Expectation(ABC, metaclass=MetaExpectation):
     ):
         return [
             RenderedStringTemplateContent(
-                **{
-                    "content_block_type": "string_template",
-                    "styling": {"parent": {"classes": ["alert", "alert-warning"]}},
-                    "string_template": {
-                        "template": "$expectation_type(**$kwargs)",
-                        "params": {
-                            "expectation_type": configuration.expectation_type,
-                            "kwargs": configuration.kwargs,
-                        },
-                        "styling": {
-                            "params": {
-                                "expectation_type": {
-                                    "classes": ["badge", "badge-warning"],
-                                }
-                            }
-                        },
+                content_block_type="string_template",
+                styling=_PRESCRIPTIVE_STYLING,
+                string_template={
+                    "template": "$expectation_type(**$kwargs)",
+                    "params": {
+                        "expectation_type": configuration.expectation_type,
+                        "kwargs": configuration.kwargs,
                     },
-                }
+                    "styling": _PRESCRIPTIVE_TEMPLATE_STYLING,
+                },
             )
         ]
 
@@ -204,73 +363,16 @@ class Expectation(ABC, metaclass=MetaExpectation):
     ):
         assert result, "Must provide a result object."
         if result.exception_info["raised_exception"]:
-            return RenderedStringTemplateContent(
-                **{
-                    "content_block_type": "string_template",
-                    "string_template": {
-                        "template": "$icon",
-                        "params": {"icon": "", "markdown_status_icon": "❗"},
-                        "styling": {
-                            "params": {
-                                "icon": {
-                                    "classes": [
-                                        "fas",
-                                        "fa-exclamation-triangle",
-                                        "text-warning",
-                                    ],
-                                    "tag": "i",
-                                }
-                            }
-                        },
-                    },
-                }
-            )
+            return _status_icon_content("❗", _STATUS_ICON_EXCEPTION_STYLING)
 
         if result.success:
-            return RenderedStringTemplateContent(
-                **{
-                    "content_block_type": "string_template",
-                    "string_template": {
-                        "template": "$icon",
-                        "params": {"icon": "", "markdown_status_icon": "✅"},
-                        "styling": {
-                            "params": {
-                                "icon": {
-                                    "classes": [
-                                        "fas",
-                                        "fa-check-circle",
-                                        "text-success",
-                                    ],
-                                    "tag": "i",
-                                }
-                            }
-                        },
-                    },
-                    "styling": {
-                        "parent": {
-                            "classes": ["hide-succeeded-validation-target-child"]
-                        }
-                    },
-                }
+            return _status_icon_content(
+                "✅",
+                _STATUS_ICON_SUCCESS_STYLING,
+                styling=_STATUS_ICON_SUCCESS_PARENT_STYLING,
             )
         else:
-            return RenderedStringTemplateContent(
-                **{
-                    "content_block_type": "string_template",
-                    "string_template": {
-                        "template": "$icon",
-                        "params": {"icon": "", "markdown_status_icon": "❌"},
-                        "styling": {
-                            "params": {
-                                "icon": {
-                                    "tag": "i",
-                                    "classes": ["fas", "fa-times", "text-danger"],
-                                }
-                            }
-                        },
-                    },
-                }
-            )
+            return _status_icon_content("❌", _STATUS_ICON_FAILURE_STYLING)
 
     @classmethod
     @renderer(renderer_type="renderer.diagnostic.unexpected_statement")
@@ -283,72 +385,23 @@ class Expectation(ABC, metaclass=MetaExpectation):
         **kwargs,
     ):
         assert result, "Must provide a result object."
-        success = result.success
-        result_dict = result.result
-
-        if result.exception_info["raised_exception"]:
-            exception_message_template_str = (
-                "\n\n$expectation_type raised an exception:\n$exception_message"
-            )
-
-            exception_message = RenderedStringTemplateContent(
-                **{
-                    "content_block_type": "string_template",
-                    "string_template": {
-                        "template": exception_message_template_str,
-                        "params": {
-                            "expectation_type": result.expectation_config.expectation_type,
-                            "exception_message": result.exception_info[
-                                "exception_message"
-                            ],
-                        },
-                        "tag": "strong",
-                        "styling": {
-                            "classes": ["text-danger"],
-                            "params": {
-                                "exception_message": {"tag": "code"},
-                                "expectation_type": {
-                                    "classes": ["badge", "badge-danger", "mb-2"]
-                                },
-                            },
-                        },
-                    },
-                }
-            )
-
-            exception_traceback_collapse = CollapseContent(
-                **{
-                    "collapse_toggle_link": "Show exception traceback...",
-                    "collapse": [
-                        RenderedStringTemplateContent(
-                            **{
-                                "content_block_type": "string_template",
-                                "string_template": {
-                                    "template": result.exception_info[
-                                        "exception_traceback"
-                                    ],
-                                    "tag": "code",
-                                },
-                            }
-                        )
-                    ],
-                }
+        exception_info = result.exception_info
+        if exception_info["raised_exception"]:
+            return _exception_content_blocks(
+                result.expectation_config.expectation_type, exception_info
             )
 
-            return [exception_message, exception_traceback_collapse]
+        success = result.success
+        result_dict = result.result
 
         if success or not result_dict.get("unexpected_count"):
             return []
         else:
-            unexpected_count = num_to_str(
-                result_dict["unexpected_count"], use_locale=True, precision=20
-            )
+            unexpected_count = _count_to_str(result_dict["unexpected_count"])
             unexpected_percent = (
                 num_to_str(result_dict["unexpected_percent"], precision=4) + "%"
             )
-            element_count = num_to_str(
-                result_dict["element_count"], use_locale=True, precision=20
-            )
+            element_count = _count_to_str(result_dict["element_count"])
 
             template_str = (
                 "\n\n$unexpected_count unexpected values found. "
@@ -403,23 +456,28 @@ class Expectation(ABC, metaclass=MetaExpectation):
             # accounted for in our count, and include counts if we do. If we do not,
             # we will use this as simply a better (non-repeating) source of
             # "sampled" unexpected values
-            total_count = 0
-            for unexpected_count_dict in result_dict.get("partial_unexpected_counts"):
-                if not isinstance(unexpected_count_dict, dict):
-                    # handles case: "partial_exception_counts requires a hashable type"
-                    # this case is also now deprecated (because the error is moved to an errors key
-                    # the error also *should have* been updated to "partial_unexpected_counts ..." long ago.
-                    # NOTE: JPC 20200724 - Consequently, this codepath should be removed by approximately Q1 2021
-                    continue
-                value = unexpected_count_dict.get("value")
-                count = unexpected_count_dict.get("count")
-                total_count += count
-                if value is not None and value != "":
-                    table_rows.append([value, count])
-                elif value == "":
-                    table_rows.append(["EMPTY", count])
-                else:
-                    table_rows.append(["null", count])
+            unexpected_counts = [
+                unexpected_count_dict
+                for unexpected_count_dict in result_dict.get(
+                    "partial_unexpected_counts"
+                )
+                # handles case: "partial_exception_counts requires a hashable type"
+                # this case is also now deprecated (because the error is moved to an errors key
+                # the error also *should have* been updated to "partial_unexpected_counts ..." long ago.
+                # NOTE: JPC 20200724 - Consequently, this codepath should be removed by approximately Q1 2021
+                if isinstance(unexpected_count_dict, dict)
+            ]
+            total_count = sum(
+                unexpected_count_dict.get("count")
+                for unexpected_count_dict in unexpected_counts
+            )
+            table_rows = [
+                [
+                    _unexpected_value_label(unexpected_count_dict.get("value")),
+                    unexpected_count_dict.get("count"),
+                ]
+                for unexpected_count_dict in unexpected_counts
+            ]
 
             # Check to see if we have *all* of the unexpected values accounted for. If so,
             # we show counts. If not, we only show "sampled" unexpected values.
@@ -430,17 +488,18 @@ class Expectation(ABC, metaclass=MetaExpectation):
                 table_rows = [[row[0]] for row in table_rows]
         else:
             header_row = ["Sampled Unexpected Values"]
-            sampled_values_set = set()
+            # Deduplicate on the displayed value, keeping the first raw value seen for each
+            sampled_values = {}
             for unexpected_value in result_dict.get("partial_unexpected_list"):
-                if unexpected_value:
-                    string_unexpected_value = str(unexpected_value)
-                elif unexpected_value == "":
-                    string_unexpected_value = "EMPTY"
-                else:
-                    string_unexpected_value = "null"
-                if string_unexpected_value not in sampled_values_set:
-                    table_rows.append([unexpected_value])
-                    sampled_values_set.add(string_unexpected_value)
+                sampled_values.setdefault(
+                    str(unexpected_value)
+                    if unexpected_value
+                    else ("EMPTY" if unexpected_value == "" else "null"),
+                    unexpected_value,
+                )
+            table_rows = [
+                [unexpected_value] for unexpected_value in sampled_values.values()
+            ]
 
         unexpected_table_content_block = RenderedTableContent(
             **{
@@ -486,7 +545,7 @@ class Expectation(ABC, metaclass=MetaExpectation):
 
     @classmethod
     def get_allowed_config_keys(cls):
-        return cls.domain_keys + cls.success_keys + cls.runtime_keys
+        return cls._allowed_config_keys
 
     def _validate(
         self,
@@ -546,75 +605,78 @@ class Expectation(ABC, metaclass=MetaExpectation):
         runtime_configuration: Optional[dict] = None,
     ):
         """Returns the result format and metrics required to validate this Expectation using the provided result format."""
+        # get_runtime_kwargs has already parsed the result_format
         return {
-            "result_format": parse_result_format(
-                self.get_runtime_kwargs(
-                    configuration=configuration,
-                    runtime_configuration=runtime_configuration,
-                ).get("result_format")
-            ),
+            "result_format": self.get_runtime_kwargs(
+                configuration=configuration,
+                runtime_configuration=runtime_configuration,
+            ).get("result_format"),
             "metrics": dict(),
         }
 
-    def get_domain_kwargs(
-        self, configuration: Optional[ExpectationConfiguration] = None
-    ):
+    def _resolve_kwargs(
+        self,
+        configuration: Optional[ExpectationConfiguration] = None,
+        runtime_configuration: Optional[dict] = None,
+        tier: str = "runtime",
+    ) -> dict:
+        """Resolve the kwargs of the given tier ("domain", "success" or "runtime") in a single pass, falling back
+        to default_kwarg_values for any key missing from the configuration."""
         if not configuration:
             configuration = self.configuration
 
-        domain_kwargs = {
-            key: configuration.kwargs.get(key, self.default_kwarg_values.get(key))
-            for key in self.domain_keys
+        # Only copy the kwargs when runtime overrides have to be layered on top of them
+        kwargs = configuration.kwargs
+        if runtime_configuration:
+            kwargs = dict(kwargs)
+            kwargs.update(runtime_configuration)
+
+        default_kwarg_values = self.default_kwarg_values
+        return {
+            key: kwargs.get(key, default_kwarg_values.get(key))
+            for key in self._kwargs_keys_by_tier[tier]
         }
-        # Process evaluation parameter dependencies
 
-        missing_kwargs = set(self.domain_keys) - set(domain_kwargs.keys())
-        if missing_kwargs:
-            raise InvalidExpectationKwargsError(
-                f"Missing domain kwargs: {list(missing_kwargs)}"
-            )
-        return domain_kwargs
+    def get_domain_kwargs(
+        self, configuration: Optional[ExpectationConfiguration] = None
+    ):
+        return self._resolve_kwargs(configuration, tier="domain")
 
     def get_success_kwargs(
         self, configuration: Optional[ExpectationConfiguration] = None
     ):
-        if not configuration:
-            configuration = self.configuration
-
-        domain_kwargs = self.get_domain_kwargs(configuration)
-        success_kwargs = {
-            key: configuration.kwargs.get(key, self.default_kwarg_values.get(key))
-            for key in self.success_keys
-        }
-        success_kwargs.update(domain_kwargs)
-        return success_kwargs
+        return self._resolve_kwargs(configuration, tier="success")
 
     def get_runtime_kwargs(
         self,
         configuration: Optional[ExpectationConfiguration] = None,
         runtime_configuration: dict = None,
     ):
-        if not configuration:
-            configuration = self.configuration
-
-        configuration = deepcopy(configuration)
+        runtime_kwargs = self._resolve_kwargs(
+            configuration, runtime_configuration, tier="runtime"
+        )
 
-        if runtime_configuration:
-            configuration.kwargs.update(runtime_configuration)
+        result_format = runtime_kwargs["result_format"]
+        if isinstance(result_format, dict):
+            # parse_result_format fills in defaults in place; do not leak them into the configuration
+            result_format = dict(result_format)
+        runtime_kwargs["result_format"] = parse_result_format(result_format)
 
-        success_kwargs = self.get_success_kwargs(configuration)
-        runtime_kwargs = {
-            key: configuration.kwargs.get(key, self.default_kwarg_values.get(key))
-            for key in self.runtime_keys
-        }
-        runtime_kwargs.update(success_kwargs)
+        return runtime_kwargs
 
-        runtime_kwargs["result_format"] = parse_result_format(
-            runtime_kwargs["result_format"]
+    def get_result_format(
+        self,
+        configuration: ExpectationConfiguration,
+        runtime_configuration: Optional[dict] = None,
+    ):
+        """Return the result_format requested at runtime, falling back to the configured value and then the
+        expectation's default."""
+        if runtime_configuration and "result_format" in runtime_configuration:
+            return runtime_configuration["result_format"]
+        return configuration.kwargs.get(
+            "result_format", self.default_kwarg_values.get("result_format")
         )
 
-        return runtime_kwargs
-
     def validate_configuration(self, configuration: Optional[ExpectationConfiguration]):
         if configuration is None:
             configuration = self.configuration
@@ -689,12 +751,14 @@ class Expectation(ABC, metaclass=MetaExpectation):
         # Construct the expectation_config object
         return ExpectationConfiguration(
             expectation_type=cls.expectation_type,
-            kwargs=convert_to_json_serializable(deepcopy(all_args)),
+            # convert_to_json_serializable builds new containers all the way down, so all_args is not shared
+            kwargs=convert_to_json_serializable(all_args),
             meta=meta,
         )
 
 
 class TableExpectation(Expectation, ABC):
+    __slots__ = ()
     domain_keys = (
         "batch_id",
         "table",
@@ -712,12 +776,12 @@ class TableExpectation(Expectation, ABC):
         dependencies = super().get_validation_dependencies(
             configuration, execution_engine, runtime_configuration
         )
-        for metric_name in self.metric_dependencies:
-            metric_kwargs = get_metric_kwargs(
-                metric_name=metric_name,
-                configuration=configuration,
-                runtime_configuration=runtime_configuration,
-            )
+        metric_kwargs_by_name = get_metric_kwargs_batch(
+            metric_names=self.metric_dependencies,
+            configuration=configuration,
+            runtime_configuration=runtime_configuration,
+        )
+        for metric_name, metric_kwargs in metric_kwargs_by_name.items():
             dependencies["metrics"][metric_name] = MetricConfiguration(
                 metric_name=metric_name,
                 metric_domain_kwargs=metric_kwargs["metric_domain_kwargs"],
@@ -800,6 +864,7 @@ class TableExpectation(Expectation, ABC):
 
 
 class ColumnExpectation(TableExpectation, ABC):
+    __slots__ = ()
     domain_keys = ("batch_id", "table", "column", "row_condition", "condition_parser")
 
     def validate_configuration(self, configuration: Optional[ExpectationConfiguration]):
@@ -813,9 +878,17 @@ class ColumnExpectation(TableExpectation, ABC):
         return True
 
 
-class ColumnMapExpectation(TableExpectation, ABC):
+class _MapExpectationBase(TableExpectation, ABC):
+    """Shared implementation of ColumnMapExpectation and ColumnPairMapExpectation.
+
+    Subclasses declare their map_metric, their domain_keys and the kwargs that must be present in every
+    configuration (`_required_kwargs`).
+    """
+
+    __slots__ = ()
     map_metric = None
-    domain_keys = ("batch_id", "table", "column", "row_condition", "condition_parser")
+    _required_kwargs = tuple()
+    _map_expectation_kind = None
     success_keys = ("mostly",)
     default_kwarg_values = {
         "row_condition": None,
@@ -826,21 +899,82 @@ class ColumnMapExpectation(TableExpectation, ABC):
         "catch_exceptions": True,
     }
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # The names of the metrics derived from map_metric are built once per class, rather than on every call
+        if not isinstance(cls.map_metric, str):
+            # get_validation_dependencies rejects a missing or malformed map_metric
+            cls._unexpected_count_metric = None
+            cls._unexpected_values_metric = None
+            cls._unexpected_rows_metric = None
+            cls._unexpected_index_list_metric = None
+        else:
+            cls._unexpected_count_metric = cls.map_metric + ".unexpected_count"
+            cls._unexpected_values_metric = cls.map_metric + ".unexpected_values"
+            cls._unexpected_rows_metric = cls.map_metric + ".unexpected_rows"
+            cls._unexpected_index_list_metric = (
+                cls.map_metric + ".unexpected_index_list"
+            )
+        # The dependencies only vary with the result_format level and the kind of engine, so list them once
+        cls._metric_dependency_names = {
+            (level, is_pandas): cls._list_metric_dependency_names(level, is_pandas)
+            for level in ResultFormatLevel
+            for is_pandas in (False, True)
+        }
+
+    @classmethod
+    def _list_metric_dependency_names(
+        cls, level: ResultFormatLevel, is_pandas: bool
+    ) -> Tuple[str, ...]:
+        metric_names = [
+            "column_values.nonnull.unexpected_count",
+            cls._unexpected_count_metric,
+            "table.row_count",
+        ]
+        if level >= ResultFormatLevel.BASIC:
+            metric_names.append(cls._unexpected_values_metric)
+        if level >= ResultFormatLevel.COMPLETE:
+            metric_names.append(cls._unexpected_rows_metric)
+            if is_pandas:
+                metric_names.append(cls._unexpected_index_list_metric)
+        return tuple(metric_names)
+
+    @classmethod
+    def _get_metric_dependency_names(
+        cls, result_format_str: str, execution_engine: Optional[ExecutionEngine] = None
+    ) -> Tuple[str, ...]:
+        """Return the names of the metrics needed to report a result in the given result_format.
+
+        Unrecognized result_format strings are treated as COMPLETE, so that any error is raised when the result is
+        formatted rather than here.
+        """
+        level = ResultFormatLevel.__members__.get(
+            result_format_str, ResultFormatLevel.COMPLETE
+        )
+        return cls._metric_dependency_names[
+            level, isinstance(execution_engine, PandasExecutionEngine)
+        ]
+
     def validate_configuration(self, configuration: Optional[ExpectationConfiguration]):
         if not super().validate_configuration(configuration):
             return False
-        try:
-            assert (
-                "column" in configuration.kwargs
-            ), "'column' parameter is required for column map expectations"
-            if "mostly" in configuration.kwargs:
-                mostly = configuration.kwargs["mostly"]
-                assert isinstance(
-                    mostly, (int, float)
-                ), "'mostly' parameter must be an integer or float"
-                assert 0 <= mostly <= 1, "'mostly' parameter must be between 0 and 1"
-        except AssertionError as e:
-            raise InvalidExpectationConfigurationError(str(e))
+        for required_kwarg in self._required_kwargs:
+            if required_kwarg not in configuration.kwargs:
+                raise InvalidExpectationConfigurationError(
+                    "'{}' parameter is required for {} expectations".format(
+                        required_kwarg, self._map_expectation_kind
+                    )
+                )
+        if "mostly" in configuration.kwargs:
+            mostly = configuration.kwargs["mostly"]
+            if not isinstance(mostly, (int, float)):
+                raise InvalidExpectationConfigurationError(
+                    "'mostly' parameter must be an integer or float"
+                )
+            if not 0 <= mostly <= 1:
+                raise InvalidExpectationConfigurationError(
+                    "'mostly' parameter must be between 0 and 1"
+                )
         return True
 
     def get_validation_dependencies(
@@ -852,90 +986,34 @@ class ColumnMapExpectation(TableExpectation, ABC):
         dependencies = super().get_validation_dependencies(
             configuration, execution_engine, runtime_configuration
         )
-        assert isinstance(
-            self.map_metric, str
-        ), "ColumnMapExpectation must override get_validation_dependencies or declare exactly one map_metric"
-        assert (
-            self.metric_dependencies == tuple()
-        ), "ColumnMapExpectation must be configured using map_metric, and cannot have metric_dependencies declared."
+        if not isinstance(self.map_metric, str):
+            raise GreatExpectationsError(
+                "{} must override get_validation_dependencies or declare exactly one map_metric".format(
+                    self.__class__.__name__
+                )
+            )
+        if self.metric_dependencies != tuple():
+            raise GreatExpectationsError(
+                "{} must be configured using map_metric, and cannot have metric_dependencies declared.".format(
+                    self.__class__.__name__
+                )
+            )
         # convenient name for updates
         metric_dependencies = dependencies["metrics"]
-        metric_kwargs = get_metric_kwargs(
-            metric_name="column_values.nonnull.unexpected_count",
-            configuration=configuration,
-            runtime_configuration=runtime_configuration,
-        )
-        metric_dependencies[
-            "column_values.nonnull.unexpected_count"
-        ] = MetricConfiguration(
-            "column_values.nonnull.unexpected_count",
-            metric_domain_kwargs=metric_kwargs["metric_domain_kwargs"],
-            metric_value_kwargs=metric_kwargs["metric_value_kwargs"],
-        )
-        metric_kwargs = get_metric_kwargs(
-            metric_name=self.map_metric + ".unexpected_count",
-            configuration=configuration,
-            runtime_configuration=runtime_configuration,
-        )
-        metric_dependencies[
-            self.map_metric + ".unexpected_count"
-        ] = MetricConfiguration(
-            self.map_metric + ".unexpected_count",
-            metric_domain_kwargs=metric_kwargs["metric_domain_kwargs"],
-            metric_value_kwargs=metric_kwargs["metric_value_kwargs"],
-        )
-
         result_format_str = dependencies["result_format"].get("result_format")
-        metric_kwargs = get_metric_kwargs(
-            metric_name="table.row_count",
-            configuration=configuration,
-            runtime_configuration=runtime_configuration,
-        )
-        metric_dependencies["table.row_count"] = MetricConfiguration(
-            metric_name="table.row_count",
-            metric_domain_kwargs=metric_kwargs["metric_domain_kwargs"],
-            metric_value_kwargs=metric_kwargs["metric_value_kwargs"],
-        )
-        if result_format_str == "BOOLEAN_ONLY":
-            return dependencies
-
-        metric_kwargs = get_metric_kwargs(
-            self.map_metric + ".unexpected_values",
-            configuration=configuration,
-            runtime_configuration=runtime_configuration,
-        )
-        metric_dependencies[
-            self.map_metric + ".unexpected_values"
-        ] = MetricConfiguration(
-            metric_name=self.map_metric + ".unexpected_values",
-            metric_domain_kwargs=metric_kwargs["metric_domain_kwargs"],
-            metric_value_kwargs=metric_kwargs["metric_value_kwargs"],
+        metric_names = self._get_metric_dependency_names(
+            result_format_str, execution_engine
         )
 
-        if result_format_str in ["BASIC", "SUMMARY"]:
-            return dependencies
-
-        metric_kwargs = get_metric_kwargs(
-            self.map_metric + ".unexpected_rows",
+        # The configuration's runtime kwargs are resolved once and shared by all of the metrics
+        metric_kwargs_by_name = get_metric_kwargs_batch(
+            metric_names=metric_names,
             configuration=configuration,
             runtime_configuration=runtime_configuration,
         )
-        metric_dependencies[self.map_metric + ".unexpected_rows"] = MetricConfiguration(
-            metric_name=self.map_metric + ".unexpected_rows",
-            metric_domain_kwargs=metric_kwargs["metric_domain_kwargs"],
-            metric_value_kwargs=metric_kwargs["metric_value_kwargs"],
-        )
-
-        if isinstance(execution_engine, PandasExecutionEngine):
-            metric_kwargs = get_metric_kwargs(
-                self.map_metric + ".unexpected_index_list",
-                configuration=configuration,
-                runtime_configuration=runtime_configuration,
-            )
-            metric_dependencies[
-                self.map_metric + ".unexpected_index_list"
-            ] = MetricConfiguration(
-                metric_name=self.map_metric + ".unexpected_index_list",
+        for metric_name, metric_kwargs in metric_kwargs_by_name.items():
+            metric_dependencies[metric_name] = MetricConfiguration(
+                metric_name=metric_name,
                 metric_domain_kwargs=metric_kwargs["metric_domain_kwargs"],
                 metric_value_kwargs=metric_kwargs["metric_value_kwargs"],
             )
@@ -949,58 +1027,46 @@ class ColumnMapExpectation(TableExpectation, ABC):
         runtime_configuration: dict = None,
         execution_engine: ExecutionEngine = None,
     ):
-        if runtime_configuration:
-            result_format = runtime_configuration.get(
-                "result_format",
-                configuration.kwargs.get(
-                    "result_format", self.default_kwarg_values.get("result_format")
-                ),
-            )
-        else:
-            result_format = configuration.kwargs.get(
-                "result_format", self.default_kwarg_values.get("result_format")
-            )
-        mostly = self.get_success_kwargs().get(
+        result_format = self.get_result_format(configuration, runtime_configuration)
+        mostly = configuration.kwargs.get(
             "mostly", self.default_kwarg_values.get("mostly")
         )
         total_count = metrics.get("table.row_count")
         null_count = metrics.get("column_values.nonnull.unexpected_count")
-        unexpected_count = metrics.get(self.map_metric + ".unexpected_count")
+        unexpected_count = metrics.get(self._unexpected_count_metric)
 
-        success = None
         if total_count is None or null_count is None:
+            nonnull_count = None
             # Vacuously true
             success = True
-        elif (total_count - null_count) != 0:
-            success_ratio = (total_count - unexpected_count - null_count) / (
-                total_count - null_count
-            )
-            success = success_ratio >= mostly
-        elif total_count == 0 or (total_count - null_count) == 0:
-            success = True
-
-        try:
-            nonnull_count = metrics.get("table.row_count") - metrics.get(
-                "column_values.nonnull.unexpected_count"
-            )
-        except TypeError:
-            nonnull_count = None
+        else:
+            nonnull_count = total_count - null_count
+            if nonnull_count == 0:
+                # Vacuously true
+                success = True
+            else:
+                success = (nonnull_count - unexpected_count) / nonnull_count >= mostly
 
         return _format_map_output(
             result_format=parse_result_format(result_format),
             success=success,
-            element_count=metrics.get("table.row_count"),
+            element_count=total_count,
             nonnull_count=nonnull_count,
-            unexpected_count=metrics.get(self.map_metric + ".unexpected_count"),
-            unexpected_list=metrics.get(self.map_metric + ".unexpected_values"),
-            unexpected_index_list=metrics.get(
-                self.map_metric + ".unexpected_index_list"
-            ),
+            unexpected_count=unexpected_count,
+            unexpected_list=metrics.get(self._unexpected_values_metric),
+            unexpected_index_list=metrics.get(self._unexpected_index_list_metric),
         )
 
 
-class ColumnPairMapExpectation(TableExpectation, ABC):
-    map_metric = None
+class ColumnMapExpectation(_MapExpectationBase, ABC):
+    __slots__ = ()
+    domain_keys = ("batch_id", "table", "column", "row_condition", "condition_parser")
+    _required_kwargs = ("column",)
+    _map_expectation_kind = "column map"
+
+
+class ColumnPairMapExpectation(_MapExpectationBase, ABC):
+    __slots__ = ()
     domain_keys = (
         "batch_id",
         "table",
@@ -1009,191 +1075,8 @@ class ColumnPairMapExpectation(TableExpectation, ABC):
         "row_condition",
         "condition_parser",
     )
-    success_keys = ("mostly",)
-    default_kwarg_values = {
-        "row_condition": None,
-        "condition_parser": None,  # we expect this to be explicitly set whenever a row_condition is passed
-        "mostly": 1,
-        "result_format": "BASIC",
-        "include_config": True,
-        "catch_exceptions": True,
-    }
-
-    def validate_configuration(self, configuration: Optional[ExpectationConfiguration]):
-        if not super().validate_configuration(configuration):
-            return False
-        try:
-            assert (
-                "column_A" in configuration.kwargs
-            ), "'column_A' parameter is required for column pair map expectations"
-            assert (
-                "column_B" in configuration.kwargs
-            ), "'column_B' parameter is required for column pair map expectations"
-            if "mostly" in configuration.kwargs:
-                mostly = configuration.kwargs["mostly"]
-                assert isinstance(
-                    mostly, (int, float)
-                ), "'mostly' parameter must be an integer or float"
-                assert 0 <= mostly <= 1, "'mostly' parameter must be between 0 and 1"
-        except AssertionError as e:
-            raise InvalidExpectationConfigurationError(str(e))
-        return True
-
-    def get_validation_dependencies(
-        self,
-        configuration: Optional[ExpectationConfiguration] = None,
-        execution_engine: Optional[ExecutionEngine] = None,
-        runtime_configuration: Optional[dict] = None,
-    ):
-        dependencies = super().get_validation_dependencies(
-            configuration, execution_engine, runtime_configuration
-        )
-        assert isinstance(
-            self.map_metric, str
-        ), "ColumnPairMapExpectation must override get_validation_dependencies or declare exactly one map_metric"
-        assert (
-            self.metric_dependencies == tuple()
-        ), "ColumnPairMapExpectation must be configured using map_metric, and cannot have metric_dependencies declared."
-        # convenient name for updates
-        metric_dependencies = dependencies["metrics"]
-        metric_kwargs = get_metric_kwargs(
-            metric_name="column_values.nonnull.unexpected_count",
-            configuration=configuration,
-            runtime_configuration=runtime_configuration,
-        )
-        metric_dependencies[
-            "column_values.nonnull.unexpected_count"
-        ] = MetricConfiguration(
-            "column_values.nonnull.unexpected_count",
-            metric_domain_kwargs=metric_kwargs["metric_domain_kwargs"],
-            metric_value_kwargs=metric_kwargs["metric_value_kwargs"],
-        )
-        metric_kwargs = get_metric_kwargs(
-            metric_name=self.map_metric + ".unexpected_count",
-            configuration=configuration,
-            runtime_configuration=runtime_configuration,
-        )
-        metric_dependencies[
-            self.map_metric + ".unexpected_count"
-        ] = MetricConfiguration(
-            self.map_metric + ".unexpected_count",
-            metric_domain_kwargs=metric_kwargs["metric_domain_kwargs"],
-            metric_value_kwargs=metric_kwargs["metric_value_kwargs"],
-        )
-
-        result_format_str = dependencies["result_format"].get("result_format")
-        if result_format_str == "BOOLEAN_ONLY":
-            return dependencies
-
-        metric_kwargs = get_metric_kwargs(
-            metric_name="table.row_count",
-            configuration=configuration,
-            runtime_configuration=runtime_configuration,
-        )
-        metric_dependencies["table.row_count"] = MetricConfiguration(
-            metric_name="table.row_count",
-            metric_domain_kwargs=metric_kwargs["metric_domain_kwargs"],
-            metric_value_kwargs=metric_kwargs["metric_value_kwargs"],
-        )
-
-        metric_kwargs = get_metric_kwargs(
-            self.map_metric + ".unexpected_values",
-            configuration=configuration,
-            runtime_configuration=runtime_configuration,
-        )
-        metric_dependencies[
-            self.map_metric + ".unexpected_values"
-        ] = MetricConfiguration(
-            metric_name=self.map_metric + ".unexpected_values",
-            metric_domain_kwargs=metric_kwargs["metric_domain_kwargs"],
-            metric_value_kwargs=metric_kwargs["metric_value_kwargs"],
-        )
-
-        if result_format_str in ["BASIC", "SUMMARY"]:
-            return dependencies
-
-        metric_kwargs = get_metric_kwargs(
-            self.map_metric + ".unexpected_rows",
-            configuration=configuration,
-            runtime_configuration=runtime_configuration,
-        )
-        metric_dependencies[self.map_metric + ".unexpected_rows"] = MetricConfiguration(
-            metric_name=self.map_metric + ".unexpected_rows",
-            metric_domain_kwargs=metric_kwargs["metric_domain_kwargs"],
-            metric_value_kwargs=metric_kwargs["metric_value_kwargs"],
-        )
-
-        if isinstance(execution_engine, PandasExecutionEngine):
-            metric_kwargs = get_metric_kwargs(
-                self.map_metric + ".unexpected_index_list",
-                configuration=configuration,
-                runtime_configuration=runtime_configuration,
-            )
-            metric_dependencies[
-                self.map_metric + ".unexpected_index_list"
-            ] = MetricConfiguration(
-                metric_name=self.map_metric + ".unexpected_index_list",
-                metric_domain_kwargs=metric_kwargs["metric_domain_kwargs"],
-                metric_value_kwargs=metric_kwargs["metric_value_kwargs"],
-            )
-
-        return dependencies
-
-    def _validate(
-        self,
-        configuration: ExpectationConfiguration,
-        metrics: Dict,
-        runtime_configuration: dict = None,
-        execution_engine: ExecutionEngine = None,
-    ):
-        if runtime_configuration:
-            result_format = runtime_configuration.get(
-                "result_format",
-                configuration.kwargs.get(
-                    "result_format", self.default_kwarg_values.get("result_format")
-                ),
-            )
-        else:
-            result_format = configuration.kwargs.get(
-                "result_format", self.default_kwarg_values.get("result_format")
-            )
-        mostly = self.get_success_kwargs().get(
-            "mostly", self.default_kwarg_values.get("mostly")
-        )
-        total_count = metrics.get("table.row_count")
-        null_count = metrics.get("column_values.nonnull.unexpected_count")
-        unexpected_count = metrics.get(self.map_metric + ".unexpected_count")
-
-        success = None
-        if total_count is None or null_count is None:
-            # Vacuously true
-            success = True
-        elif (total_count - null_count) != 0:
-            success_ratio = (total_count - unexpected_count - null_count) / (
-                total_count - null_count
-            )
-            success = success_ratio >= mostly
-        elif total_count == 0 or (total_count - null_count) == 0:
-            success = True
-
-        try:
-            nonnull_count = metrics.get("table.row_count") - metrics.get(
-                "column_values.nonnull.unexpected_count"
-            )
-        except TypeError:
-            nonnull_count = None
-
-        return _format_map_output(
-            result_format=parse_result_format(result_format),
-            success=success,
-            element_count=metrics.get("table.row_count"),
-            nonnull_count=nonnull_count,
-            unexpected_count=metrics.get(self.map_metric + ".unexpected_count"),
-            unexpected_list=metrics.get(self.map_metric + ".unexpected_values"),
-            unexpected_index_list=metrics.get(
-                self.map_metric + ".unexpected_index_list"
-            ),
-        )
+    _required_kwargs = ("column_A", "column_B")
+    _map_expectation_kind = "column pair map"
 
 
 def _format_map_output(
@@ -1218,9 +1101,17 @@ def _format_map_output(
     # Incrementally add to result and return when all values for the specified level are present
     return_obj = {"success": success}
 
-    if result_format["result_format"] == "BOOLEAN_ONLY":
+    level = ResultFormatLevel.__members__.get(result_format["result_format"])
+    if level is None:
+        raise ValueError(
+            "Unknown result_format {}.".format(result_format["result_format"])
+        )
+
+    if level == ResultFormatLevel.BOOLEAN_ONLY:
         return return_obj
 
+    partial_unexpected_count = result_format["partial_unexpected_count"]
+
     skip_missing = False
 
     if nonnull_count is None:
@@ -1229,7 +1120,27 @@ def _format_map_output(
     else:
         missing_count = element_count - nonnull_count
 
-    if element_count > 0:
+    if element_count == 0:
+        # An empty batch has no percentages to compute and no unexpected values to sample
+        return_obj["result"] = {
+            "element_count": element_count,
+            "unexpected_count": unexpected_count,
+            "unexpected_percent": None,
+            "partial_unexpected_list": [],
+        }
+        if not skip_missing:
+            return_obj["result"].update(
+                {
+                    "missing_count": missing_count,
+                    "missing_percent": None,
+                    "unexpected_percent_nonmissing": None,
+                }
+            )
+
+        if level == ResultFormatLevel.BASIC:
+            return return_obj
+
+    else:
         unexpected_percent = unexpected_count / element_count * 100
 
         if not skip_missing:
@@ -1239,39 +1150,30 @@ def _format_map_output(
             else:
                 unexpected_percent_nonmissing = None
 
-    else:
-        missing_percent = None
-        unexpected_percent = None
-        unexpected_percent_nonmissing = None
-
-    return_obj["result"] = {
-        "element_count": element_count,
-        "unexpected_count": unexpected_count,
-        "unexpected_percent": unexpected_percent,
-        "partial_unexpected_list": unexpected_list[
-            : result_format["partial_unexpected_count"]
-        ],
-    }
+        return_obj["result"] = {
+            "element_count": element_count,
+            "unexpected_count": unexpected_count,
+            "unexpected_percent": unexpected_percent,
+            "partial_unexpected_list": unexpected_list[:partial_unexpected_count],
+        }
 
-    if not skip_missing:
-        return_obj["result"]["missing_count"] = missing_count
-        return_obj["result"]["missing_percent"] = missing_percent
-        return_obj["result"][
-            "unexpected_percent_nonmissing"
-        ] = unexpected_percent_nonmissing
+        if not skip_missing:
+            return_obj["result"]["missing_count"] = missing_count
+            return_obj["result"]["missing_percent"] = missing_percent
+            return_obj["result"][
+                "unexpected_percent_nonmissing"
+            ] = unexpected_percent_nonmissing
 
-    if result_format["result_format"] == "BASIC":
-        return return_obj
+        if level == ResultFormatLevel.BASIC:
+            return return_obj
 
     # Try to return the most common values, if possible.
-    if 0 < result_format.get("partial_unexpected_count"):
+    if 0 < partial_unexpected_count:
         try:
             partial_unexpected_counts = [
                 {"value": key, "count": value}
                 for key, value in sorted(
-                    Counter(unexpected_list).most_common(
-                        result_format["partial_unexpected_count"]
-                    ),
+                    Counter(unexpected_list).most_common(partial_unexpected_count),
                     key=lambda x: (-x[1], x[0]),
                 )
             ]
@@ -1283,7 +1185,7 @@ def _format_map_output(
             return_obj["result"].update(
                 {
                     "partial_unexpected_index_list": unexpected_index_list[
-                        : result_format["partial_unexpected_count"]
+                        :partial_unexpected_count
                     ]
                     if unexpected_index_list is not None
                     else None,
@@ -1291,7 +1193,7 @@ def _format_map_output(
                 }
             )
 
-    if result_format["result_format"] == "SUMMARY":
+    if level == ResultFormatLevel.SUMMARY:
         return return_obj
 
     return_obj["result"].update(
@@ -1301,7 +1203,4 @@ def _format_map_output(
         }
     )
 
-    if result_format["result_format"] == "COMPLETE":
-        return return_obj
-
-    raise ValueError("Unknown result_format {}.".format(result_format["result_format"]))
+    return return_obj
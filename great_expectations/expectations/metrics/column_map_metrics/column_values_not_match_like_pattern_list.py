@@ -1,5 +1,11 @@
 import logging
 
+import pandas as pd
+
+from great_expectations.execution_engine import (
+    PandasExecutionEngine,
+    SparkDFExecutionEngine,
+)
 from great_expectations.execution_engine.sqlalchemy_execution_engine import (
     SqlAlchemyExecutionEngine,
 )
@@ -10,6 +16,7 @@ from great_expectations.expectations.metrics.map_metric import (
 )
 from great_expectations.expectations.metrics.util import (
     get_dialect_like_pattern_expression,
+    get_like_pattern_list_regex,
 )
 
 logger = logging.getLogger(__name__)
@@ -19,6 +26,24 @@ class ColumnValuesNotMatchLikePatternList(ColumnMapMetricProvider):
     condition_metric_name = "column_values.not_match_like_pattern_list"
     condition_value_keys = ("like_pattern_list", "match_on")
 
+    @column_condition_partial(engine=PandasExecutionEngine)
+    def _pandas(cls, column, like_pattern_list, **kwargs):
+        if len(like_pattern_list) == 0:
+            raise ValueError(
+                "At least one like_pattern must be supplied in the like_pattern_list."
+            )
+
+        # Vectorized over the whole column, with a single regex matching all of the patterns. The regex is anchored at
+        # both ends, so str.match matches whole values (str.fullmatch needs pandas 1.1). Null values match no pattern.
+        not_null = column.notnull()
+        matches = pd.Series(False, index=column.index)
+        matches[not_null] = (
+            column[not_null]
+            .astype(str)
+            .str.match(get_like_pattern_list_regex(like_pattern_list))
+        )
+        return ~matches
+
     @column_condition_partial(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(cls, column, like_pattern_list, _dialect, **kwargs):
         if len(like_pattern_list) == 0:
@@ -35,6 +60,12 @@ class ColumnValuesNotMatchLikePatternList(ColumnMapMetricProvider):
             )
             raise NotImplementedError
 
+        if getattr(_dialect.dialect, "name", None) == "postgresql":
+            # A single "NOT LIKE ALL" over an array of the patterns, rather than one NOT LIKE per pattern
+            return column.notlike(
+                sa.all_(sa.dialects.postgresql.array(like_pattern_list))
+            )
+
         return sa.and_(
             *[
                 get_dialect_like_pattern_expression(
@@ -43,3 +74,13 @@ class ColumnValuesNotMatchLikePatternList(ColumnMapMetricProvider):
                 for like_pattern in like_pattern_list
             ]
         )
+
+    @column_condition_partial(engine=SparkDFExecutionEngine)
+    def _spark(cls, column, like_pattern_list, **kwargs):
+        if len(like_pattern_list) == 0:
+            raise ValueError(
+                "At least one like_pattern must be supplied in the like_pattern_list."
+            )
+
+        # A single regex matches all of the patterns in one pass over each value
+        return ~column.rlike(get_like_pattern_list_regex(like_pattern_list, spark=True))
@@ -1,4 +1,6 @@
 import logging
+import re
+from functools import lru_cache
 from typing import Dict, List, Optional, Union
 
 import numpy as np
@@ -297,6 +299,48 @@ def get_dialect_like_pattern_expression(column, dialect, like_pattern, positive=
     return None
 
 
+def get_like_pattern_list_regex(
+    like_pattern_list: List[str], spark: bool = False
+) -> str:
+    """Translate a list of SQL LIKE patterns into a single regex matching any of them against a whole value.
+
+    "%" becomes ".*", "_" becomes "." and everything else is matched literally, including "%", "_" and "\\" when they
+    are escaped with a backslash. This lets engines without LIKE test every pattern in one pass over each value.
+
+    The regex is anchored at both ends of the value, using python's re syntax by default; pass spark=True for the Java
+    syntax of Spark's rlike, which spells the end of input differently.
+    """
+    return _get_like_pattern_list_regex(tuple(like_pattern_list), spark)
+
+
+@lru_cache(maxsize=128)
+def _get_like_pattern_list_regex(like_patterns: tuple, spark: bool) -> str:
+    regexes = []
+    for like_pattern in like_patterns:
+        regex = []
+        escaped = False
+        for char in like_pattern:
+            if escaped:
+                regex.append(re.escape(char))
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == "%":
+                regex.append(".*")
+            elif char == "_":
+                regex.append(".")
+            else:
+                regex.append(re.escape(char))
+        if escaped:
+            # A trailing backslash has nothing to escape, so it is matched literally
+            regex.append(re.escape("\\"))
+        regexes.append("".join(regex))
+
+    # "$" would also match before a trailing newline
+    end_anchor = r"\z" if spark else r"\Z"
+    return r"(?s)\A(?:" + "|".join(regexes) + ")" + end_anchor
+
+
 def validate_distribution_parameters(distribution, params):
     """Ensures that necessary parameters for a distribution are present and that all parameters are sensical.
 
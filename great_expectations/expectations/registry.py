@@ -29,38 +29,36 @@ def register_renderer(
     parent_class: Type[Union["Expectation", "Metric"]],
     renderer_fn: Callable,
 ):
-    renderer_name = renderer_fn._renderer_type
-    if object_name not in _registered_renderers:
-        logger.debug(f"Registering {renderer_name} for expectation_type {object_name}.")
-        _registered_renderers[object_name] = {
-            renderer_name: (parent_class, renderer_fn)
-        }
-        return
+    register_renderers(
+        object_name=object_name, parent_class=parent_class, renderer_fns=[renderer_fn]
+    )
 
-    if renderer_name in _registered_renderers[object_name]:
-        if _registered_renderers[object_name][renderer_name] == (
-            parent_class,
-            renderer_fn,
-        ):
-            logger.info(
-                f"Multiple declarations of {renderer_name} renderer for expectation_type {object_name} "
-                f"found."
-            )
-            return
-        else:
+
+def register_renderers(
+    object_name: str,
+    parent_class: Type[Union["Expectation", "Metric"]],
+    renderer_fns: Iterable[Callable],
+):
+    """Register several renderer functions (each carrying a _renderer_type) for object_name at once."""
+    object_renderers = _registered_renderers.setdefault(object_name, {})
+    for renderer_fn in renderer_fns:
+        renderer_name = renderer_fn._renderer_type
+        if renderer_name in object_renderers:
+            if object_renderers[renderer_name] == (parent_class, renderer_fn):
+                logger.info(
+                    f"Multiple declarations of {renderer_name} renderer for expectation_type {object_name} "
+                    f"found."
+                )
+                continue
             logger.warning(
                 f"Overwriting declaration of {renderer_name} renderer for expectation_type "
                 f"{object_name}."
             )
-            _registered_renderers[object_name][renderer_name] = (
-                parent_class,
-                renderer_fn,
+        else:
+            logger.debug(
+                f"Registering {renderer_name} for expectation_type {object_name}."
             )
-        return
-    else:
-        logger.debug(f"Registering {renderer_name} for expectation_type {object_name}.")
-        _registered_renderers[object_name][renderer_name] = (parent_class, renderer_fn)
-        return
+        object_renderers[renderer_name] = (parent_class, renderer_fn)
 
 
 def get_renderer_impl(object_name, renderer_type):
@@ -197,6 +195,45 @@ def get_metric_kwargs(
     metric_name: str,
     configuration: Optional["ExpectationConfiguration"] = None,
     runtime_configuration: Optional[dict] = None,
+) -> Dict:
+    configuration_kwargs = None
+    if configuration:
+        configuration_kwargs = _get_configuration_runtime_kwargs(
+            configuration, runtime_configuration
+        )
+    return _build_metric_kwargs(metric_name, configuration_kwargs)
+
+
+def get_metric_kwargs_batch(
+    metric_names: Iterable[str],
+    configuration: Optional["ExpectationConfiguration"] = None,
+    runtime_configuration: Optional[dict] = None,
+) -> Dict[str, Dict]:
+    """Same as get_metric_kwargs, for several metrics at once; the configuration's runtime kwargs are resolved a
+    single time and shared across all of the requested metrics."""
+    configuration_kwargs = None
+    if configuration:
+        configuration_kwargs = _get_configuration_runtime_kwargs(
+            configuration, runtime_configuration
+        )
+    return {
+        metric_name: _build_metric_kwargs(metric_name, configuration_kwargs)
+        for metric_name in metric_names
+    }
+
+
+def _get_configuration_runtime_kwargs(
+    configuration: "ExpectationConfiguration",
+    runtime_configuration: Optional[dict] = None,
+) -> Dict:
+    expectation_impl = get_expectation_impl(configuration.expectation_type)
+    return expectation_impl().get_runtime_kwargs(
+        configuration=configuration, runtime_configuration=runtime_configuration
+    )
+
+
+def _build_metric_kwargs(
+    metric_name: str, configuration_kwargs: Optional[Dict] = None
 ) -> Dict:
     try:
         metric_definition = _registered_metrics.get(metric_name)
@@ -207,11 +244,7 @@ def get_metric_kwargs(
             "metric_domain_keys": metric_definition["metric_domain_keys"],
             "metric_value_keys": metric_definition["metric_value_keys"],
         }
-        if configuration:
-            expectation_impl = get_expectation_impl(configuration.expectation_type)
-            configuration_kwargs = expectation_impl().get_runtime_kwargs(
-                configuration=configuration, runtime_configuration=runtime_configuration
-            )
+        if configuration_kwargs is not None:
             if len(metric_kwargs["metric_domain_keys"]) > 0:
                 metric_domain_kwargs = IDDict(
                     {
@@ -5,6 +5,14 @@ from great_expectations.core.id_dict import IDDict
 
 
 class MetricConfiguration:
+    # Many of these are built while planning a validation, so they do without a per-instance __dict__
+    __slots__ = (
+        "_metric_name",
+        "_metric_domain_kwargs",
+        "_metric_value_kwargs",
+        "metric_dependencies",
+    )
+
     def __init__(
         self,
         metric_name: str,
@@ -2883,8 +2883,11 @@ def basic_sqlalchemy_datasource(sqlitedb_engine):
     return SqlAlchemyDatasource("basic_sqlalchemy_datasource", engine=sqlitedb_engine)
 
 
-@pytest.fixture
-def test_cases_for_sql_data_connector_sqlite_execution_engine(sa):
+# The tests only read from this database, so one execution engine is shared by all of the tests in a module. It does
+# not depend on the test_backends fixture, which is parametrized per test function and would rebuild it for every test.
+@pytest.fixture(scope="module")
+def _shared_test_cases_for_sql_data_connector_sqlite_execution_engine():
+    sa: Union[ModuleType, None] = import_library_module(module_name="sqlalchemy")
     if sa is None:
         raise ValueError("SQL Database tests require sqlalchemy to be installed.")
 
@@ -2892,11 +2895,22 @@ def test_cases_for_sql_data_connector_sqlite_execution_engine(sa):
         __file__, os.path.join("test_sets", "test_cases_for_sql_data_connector.db"),
     )
 
-    engine = sa.create_engine(f"sqlite:////{db_file}")
+    # Open the database read-only; immutable=1 also lets SQLite skip file locking
+    engine = sa.create_engine(f"sqlite:///file:{db_file}?mode=ro&immutable=1&uri=true")
     conn = engine.connect()
 
     # Build a SqlAlchemyDataset using that database
-    return SqlAlchemyExecutionEngine(name="test_sql_execution_engine", engine=conn,)
+    yield SqlAlchemyExecutionEngine(
+        name="test_sql_execution_engine", engine=conn,
+    )
+    conn.close()
+
+
+@pytest.fixture
+def test_cases_for_sql_data_connector_sqlite_execution_engine(
+    sa, _shared_test_cases_for_sql_data_connector_sqlite_execution_engine
+):
+    return _shared_test_cases_for_sql_data_connector_sqlite_execution_engine
 
 
 @pytest.fixture
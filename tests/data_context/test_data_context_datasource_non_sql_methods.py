@@ -2,15 +2,12 @@ import os
 import shutil
 
 import pandas as pd
-from ruamel.yaml import YAML
 
 from great_expectations.core.batch import Batch
 from great_expectations.data_context.util import file_relative_path
 
 from ..test_utils import create_files_in_directory
 
-yaml = YAML()
-
 
 def test_get_batch_list_from_new_style_datasource_with_file_system_datasource_inferred_assets(
     empty_data_context_v3, tmp_path_factory
@@ -33,27 +30,21 @@ def test_get_batch_list_from_new_style_datasource_with_file_system_datasource_in
         file_content_fn=lambda: "x,y,z\n1,2,3\n2,3,5",
     )
 
-    config = yaml.load(
-        f"""
-class_name: Datasource
-
-execution_engine:
-    class_name: PandasExecutionEngine
-
-data_connectors:
-    my_data_connector:
-        class_name: InferredAssetFilesystemDataConnector
-        base_directory: {base_directory}
-        glob_directive: "*/*.csv"
-
-        default_regex:
-            pattern: (.+)/(.+)-(\\d+)\\.csv
-            group_names:
-                - data_asset_name
-                - letter
-                - number
-    """,
-    )
+    config = {
+        "class_name": "Datasource",
+        "execution_engine": {"class_name": "PandasExecutionEngine"},
+        "data_connectors": {
+            "my_data_connector": {
+                "class_name": "InferredAssetFilesystemDataConnector",
+                "base_directory": base_directory,
+                "glob_directive": "*/*.csv",
+                "default_regex": {
+                    "pattern": r"(.+)/(.+)-(\d+)\.csv",
+                    "group_names": ["data_asset_name", "letter", "number"],
+                },
+            }
+        },
+    }
 
     context.add_datasource(
         "my_datasource", config,
@@ -110,33 +101,25 @@ def test_get_batch_list_from_new_style_datasource_with_file_system_datasource_co
     )
     shutil.copy(titanic_csv_source_file_path, titanic_csv_destination_file_path)
 
-    config = yaml.load(
-        f"""
-class_name: Datasource
-
-execution_engine:
-    class_name: PandasExecutionEngine
-
-data_connectors:
-    my_data_connector:
-        class_name: ConfiguredAssetFilesystemDataConnector
-        base_directory: {base_directory}
-        glob_directive: "*.csv"
-
-        default_regex:
-            pattern: (.+)\\.csv
-            group_names:
-                - name
-        assets:
-            Titanic:
-                base_directory: {titanic_asset_base_directory_path}
-                pattern: (.+)_(\\d+)_(\\d+)\\.csv
-                group_names:
-                    - name
-                    - timestamp
-                    - size
-    """,
-    )
+    config = {
+        "class_name": "Datasource",
+        "execution_engine": {"class_name": "PandasExecutionEngine"},
+        "data_connectors": {
+            "my_data_connector": {
+                "class_name": "ConfiguredAssetFilesystemDataConnector",
+                "base_directory": base_directory,
+                "glob_directive": "*.csv",
+                "default_regex": {"pattern": r"(.+)\.csv", "group_names": ["name"]},
+                "assets": {
+                    "Titanic": {
+                        "base_directory": titanic_asset_base_directory_path,
+                        "pattern": r"(.+)_(\d+)_(\d+)\.csv",
+                        "group_names": ["name", "timestamp", "size"],
+                    }
+                },
+            }
+        },
+    }
 
     context.add_datasource(
         "my_datasource", config,
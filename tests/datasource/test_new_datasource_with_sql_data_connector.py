@@ -1,6 +1,7 @@
 import json
 import os
 import random
+from weakref import WeakKeyDictionary
 
 import pytest
 from ruamel.yaml import YAML
@@ -19,6 +20,19 @@ except ImportError:
 yaml = YAML()
 
 
+@pytest.fixture
+def empty_introspection_cache(monkeypatch):
+    """Give InferredAssetSqlDataConnector an empty introspection cache, since it is otherwise shared by every
+    connector on the same engine, including those built by earlier tests."""
+    from great_expectations.datasource.data_connector import (
+        InferredAssetSqlDataConnector,
+    )
+
+    monkeypatch.setattr(
+        InferredAssetSqlDataConnector, "_catalog_cache", WeakKeyDictionary()
+    )
+
+
 def test_basic_instantiation(sa):
     random.seed(0)
 
@@ -464,6 +478,346 @@ def test_introspect_db(test_cases_for_sql_data_connector_sqlite_execution_engine
     # Need to test include_views, too.
 
 
+def test_introspect_db_lists_views_and_skips_system_views(sa):
+    from great_expectations.execution_engine import SqlAlchemyExecutionEngine
+
+    engine = sa.create_engine("sqlite://")
+    engine.execute("CREATE TABLE my_table (id INTEGER)")
+    engine.execute("CREATE VIEW my_view AS SELECT id FROM my_table")
+    engine.execute("CREATE VIEW my_system_view AS SELECT id FROM my_table")
+
+    my_data_connector = instantiate_class_from_config(
+        config={
+            "class_name": "InferredAssetSqlDataConnector",
+            "name": "my_test_data_connector",
+        },
+        runtime_environment={
+            "execution_engine": SqlAlchemyExecutionEngine(engine=engine),
+            "datasource_name": "my_test_datasource",
+        },
+        config_defaults={"module_name": "great_expectations.datasource.data_connector"},
+    )
+
+    assert my_data_connector._introspect_db(system_tables=["my_system_view"]) == [
+        {"schema_name": "main", "table_name": "my_table", "type": "table",},
+        {"schema_name": "main", "table_name": "my_view", "type": "view",},
+    ]
+    assert my_data_connector._introspect_db(include_views=False) == [
+        {"schema_name": "main", "table_name": "my_table", "type": "table",},
+    ]
+
+
+def test_introspect_db_with_bulk_table_listing_matches_inspector(
+    test_cases_for_sql_data_connector_sqlite_execution_engine, monkeypatch,
+):
+    from great_expectations.datasource.data_connector import (
+        inferred_asset_sql_data_connector,
+    )
+
+    my_data_connector = instantiate_class_from_config(
+        config={
+            "class_name": "InferredAssetSqlDataConnector",
+            "name": "my_test_data_connector",
+        },
+        runtime_environment={
+            "execution_engine": test_cases_for_sql_data_connector_sqlite_execution_engine,
+            "datasource_name": "my_test_datasource",
+        },
+        config_defaults={"module_name": "great_expectations.datasource.data_connector"},
+    )
+    inspected_tables = my_data_connector._introspect_db()
+
+    def assert_included_and_excluded_tables_are_filtered():
+        assert my_data_connector._introspect_db(
+            included_tables=[
+                "main.table_partitioned_by_date_column__A",
+                "main.table_with_fk_reference_from_F",
+                "waffle.table_with_fk_reference_from_F",
+            ],
+            excluded_tables=["main.table_with_fk_reference_from_F"],
+        ) == [
+            {
+                "schema_name": "main",
+                "table_name": "table_partitioned_by_date_column__A",
+                "type": "table",
+            },
+        ]
+        assert my_data_connector._introspect_db(
+            excluded_tables=["main.table_partitioned_by_date_column__A"]
+        ) == [
+            table
+            for table in inspected_tables
+            if table["table_name"] != "table_partitioned_by_date_column__A"
+        ]
+        assert my_data_connector._introspect_db(included_tables=[]) == []
+
+    assert_included_and_excluded_tables_are_filtered()
+
+    # sqlite has no information_schema, so stand one in for the bulk listing query.
+    monkeypatch.setitem(
+        inferred_asset_sql_data_connector.BULK_TABLE_LISTING_QUERIES,
+        "sqlite",
+        "SELECT 'main' AS table_schema, name AS table_name, "
+        "CASE type WHEN 'view' THEN 'VIEW' ELSE 'BASE TABLE' END AS table_type "
+        "FROM sqlite_master WHERE type IN ('table', 'view')",
+    )
+    assert my_data_connector._introspect_db() == inspected_tables
+    assert my_data_connector._introspect_db(schema_name="main") == inspected_tables
+    assert my_data_connector._introspect_db(schema_name="waffle") == []
+    assert_included_and_excluded_tables_are_filtered()
+
+
+def test_InferredAssetSqlDataConnector_reuses_introspection_within_ttl(
+    test_cases_for_sql_data_connector_sqlite_execution_engine,
+    monkeypatch,
+    empty_introspection_cache,
+):
+    my_data_connector = instantiate_class_from_config(
+        config={
+            "class_name": "InferredAssetSqlDataConnector",
+            "name": "my_test_data_connector",
+            "introspection_cache_ttl_seconds": 60,
+        },
+        runtime_environment={
+            "execution_engine": test_cases_for_sql_data_connector_sqlite_execution_engine,
+            "datasource_name": "my_test_datasource",
+        },
+        config_defaults={"module_name": "great_expectations.datasource.data_connector"},
+    )
+    introspect_db = my_data_connector._introspect_db
+    calls = []
+
+    def counting_introspect_db(**kwargs):
+        calls.append(kwargs)
+        return introspect_db(**kwargs)
+
+    monkeypatch.setattr(my_data_connector, "_introspect_db", counting_introspect_db)
+
+    my_data_connector._refresh_data_references_cache()
+    assert calls == []
+    assert len(my_data_connector.get_available_data_asset_names()) == 10
+
+    my_data_connector._refresh_data_references_cache(refresh=True)
+    assert len(calls) == 1
+
+    my_data_connector._introspection_cache_ttl_seconds = 0
+    my_data_connector._refresh_data_references_cache()
+    assert len(calls) == 2
+    assert len(my_data_connector.get_available_data_asset_names()) == 10
+
+
+def test_InferredAssetSqlDataConnector_introspects_on_every_refresh_by_default(sa):
+    from great_expectations.execution_engine import SqlAlchemyExecutionEngine
+
+    engine = sa.create_engine("sqlite://")
+    engine.execute("CREATE TABLE my_table (id INTEGER)")
+    my_data_connector = instantiate_class_from_config(
+        config={
+            "class_name": "InferredAssetSqlDataConnector",
+            "name": "my_test_data_connector",
+        },
+        runtime_environment={
+            "execution_engine": SqlAlchemyExecutionEngine(engine=engine),
+            "datasource_name": "my_test_datasource",
+        },
+        config_defaults={"module_name": "great_expectations.datasource.data_connector"},
+    )
+    engine.execute("CREATE TABLE my_new_table (id INTEGER)")
+
+    my_data_connector._refresh_data_references_cache()
+    assert sorted(my_data_connector.get_available_data_asset_names()) == [
+        "my_new_table",
+        "my_table",
+    ]
+
+
+def test_InferredAssetSqlDataConnector_self_check_sees_tables_created_within_ttl(sa,):
+    from great_expectations.execution_engine import SqlAlchemyExecutionEngine
+
+    engine = sa.create_engine("sqlite://")
+    engine.execute("CREATE TABLE my_table (id INTEGER)")
+    execution_engine = SqlAlchemyExecutionEngine(engine=engine)
+
+    def build_data_connector(name):
+        return instantiate_class_from_config(
+            config={
+                "class_name": "InferredAssetSqlDataConnector",
+                "name": name,
+                "introspection_cache_ttl_seconds": 60,
+            },
+            runtime_environment={
+                "execution_engine": execution_engine,
+                "datasource_name": "my_test_datasource",
+            },
+            config_defaults={
+                "module_name": "great_expectations.datasource.data_connector"
+            },
+        )
+
+    my_data_connector = build_data_connector("my_test_data_connector")
+    engine.execute("CREATE TABLE my_new_table (id INTEGER)")
+
+    # Within the TTL, refreshes (including those of new connectors) reuse the earlier introspection...
+    my_data_connector._refresh_data_references_cache()
+    assert my_data_connector.get_available_data_asset_names() == ["my_table"]
+    assert build_data_connector("other").get_available_data_asset_names() == [
+        "my_table"
+    ]
+
+    # ...but self_check introspects the database again
+    report = my_data_connector.self_check(pretty_print=False)
+    assert report["example_data_asset_names"] == ["my_new_table", "my_table"]
+    assert sorted(my_data_connector.get_available_data_asset_names()) == [
+        "my_new_table",
+        "my_table",
+    ]
+    assert sorted(build_data_connector("another").get_available_data_asset_names()) == [
+        "my_new_table",
+        "my_table",
+    ]
+
+
+def test_InferredAssetSqlDataConnectors_share_introspection_of_an_engine(
+    test_cases_for_sql_data_connector_sqlite_execution_engine,
+    monkeypatch,
+    empty_introspection_cache,
+):
+    from great_expectations.datasource.data_connector import (
+        InferredAssetSqlDataConnector,
+    )
+
+    introspect_db = InferredAssetSqlDataConnector._introspect_db
+    calls = []
+
+    def counting_introspect_db(self, **kwargs):
+        calls.append(kwargs)
+        return introspect_db(self, **kwargs)
+
+    monkeypatch.setattr(
+        InferredAssetSqlDataConnector, "_introspect_db", counting_introspect_db
+    )
+
+    def build_data_connector(name, **kwargs):
+        return instantiate_class_from_config(
+            config={
+                "class_name": "InferredAssetSqlDataConnector",
+                "name": name,
+                "introspection_cache_ttl_seconds": 60,
+                **kwargs,
+            },
+            runtime_environment={
+                "execution_engine": test_cases_for_sql_data_connector_sqlite_execution_engine,
+                "datasource_name": "my_test_datasource",
+            },
+            config_defaults={
+                "module_name": "great_expectations.datasource.data_connector"
+            },
+        )
+
+    whole_table = build_data_connector("whole_table")
+    assert len(calls) == 1
+
+    prefixed = build_data_connector("prefixed", data_asset_name_prefix="prefix__")
+    assert len(calls) == 1
+    assert len(prefixed.get_available_data_asset_names()) == len(
+        whole_table.get_available_data_asset_names()
+    )
+
+    # Different introspection arguments are introspected separately
+    build_data_connector(
+        "included", included_tables=["main.table_partitioned_by_date_column__A"],
+    )
+    assert len(calls) == 2
+
+
+def test_InferredAssetSqlDataConnector_queries_partitions_once_per_refresh(
+    test_cases_for_sql_data_connector_sqlite_execution_engine,
+):
+    my_data_connector = instantiate_class_from_config(
+        config={
+            "class_name": "InferredAssetSqlDataConnector",
+            "name": "my_test_data_connector",
+            "splitter_method": "_split_on_column_value",
+            "splitter_kwargs": {"column_name": "date"},
+            "included_tables": [
+                "main.table_containing_id_spacers_for_D",
+                "main.table_partitioned_by_date_column__A",
+                "main.table_with_fk_reference_from_F",
+            ],
+            "introspection_cache_ttl_seconds": 60,
+        },
+        runtime_environment={
+            "execution_engine": test_cases_for_sql_data_connector_sqlite_execution_engine,
+            "datasource_name": "my_test_datasource",
+        },
+        config_defaults={"module_name": "great_expectations.datasource.data_connector"},
+    )
+    executed_statements = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        executed_statements.append(statement)
+
+    connection = test_cases_for_sql_data_connector_sqlite_execution_engine.engine
+    sqlalchemy.event.listen(connection, "before_cursor_execute", record_statement)
+    try:
+        # Forget the probes run by __init__, but keep its (cached) introspection of the catalog
+        my_data_connector._partition_validation_cache = set()
+        my_data_connector._refresh_data_references_cache()
+    finally:
+        sqlalchemy.event.remove(connection, "before_cursor_execute", record_statement)
+
+    # The three tables are probed with one UNION ALL, whose rows are reused as their partition_definitions
+    assert len(executed_statements) == 1
+    assert len(my_data_connector.get_available_data_asset_names()) == 3
+    for data_asset_name, data_asset in my_data_connector.data_assets.items():
+        assert my_data_connector._data_references_cache[
+            data_asset_name
+        ] == my_data_connector._get_partition_definition_list_from_data_asset_config(
+            data_asset_name, data_asset
+        )
+
+
+def test_InferredAssetSqlDataConnector_skips_validated_tables_that_become_unqueryable(
+    sa,
+):
+    from great_expectations.execution_engine import SqlAlchemyExecutionEngine
+
+    engine = sa.create_engine("sqlite://")
+    engine.execute("CREATE TABLE my_table (id INTEGER)")
+    engine.execute("CREATE TABLE my_other_table (id INTEGER)")
+    execution_engine = SqlAlchemyExecutionEngine(engine=engine)
+
+    def build_data_connector(name, skip_inapplicable_tables):
+        return instantiate_class_from_config(
+            config={
+                "class_name": "InferredAssetSqlDataConnector",
+                "name": name,
+                "splitter_method": "_split_on_column_value",
+                "splitter_kwargs": {"column_name": "id"},
+                "skip_inapplicable_tables": skip_inapplicable_tables,
+                # Keep the dropped table in the introspected catalog
+                "introspection_cache_ttl_seconds": None,
+            },
+            runtime_environment={
+                "execution_engine": execution_engine,
+                "datasource_name": "my_test_datasource",
+            },
+            config_defaults={
+                "module_name": "great_expectations.datasource.data_connector"
+            },
+        )
+
+    skipping_data_connector = build_data_connector("skipping", True)
+    strict_data_connector = build_data_connector("strict", False)
+    engine.execute("DROP TABLE my_other_table")
+
+    skipping_data_connector._refresh_data_references_cache()
+    assert skipping_data_connector.get_available_data_asset_names() == ["my_table"]
+
+    with pytest.raises(ValueError):
+        strict_data_connector._refresh_data_references_cache()
+
+
 # Note: Abe 2020111: this test belongs with the data_connector tests, not here.
 def test_basic_instantiation_of_InferredAssetSqlDataConnector(
     test_cases_for_sql_data_connector_sqlite_execution_engine,
@@ -1,4 +1,5 @@
 import datetime
+import hashlib
 import logging
 import os
 import random
@@ -18,6 +19,9 @@ from great_expectations.exceptions import GreatExpectationsError
 from great_expectations.exceptions.metric_exceptions import MetricProviderError
 from great_expectations.execution_engine import SparkDFExecutionEngine
 from great_expectations.execution_engine.execution_engine import MetricDomainTypes
+from great_expectations.execution_engine.sparkdf_execution_engine import (
+    COMPUTE_DOMAIN_CACHE_SIZE,
+)
 from great_expectations.expectations.metrics import (
     ColumnMean,
     ColumnStandardDeviation,
@@ -123,6 +127,13 @@ def test_reader_fn(spark_session):
     fn_new = engine._get_reader_fn(reader=spark_session.read, reader_method="csv")
     assert "<bound method DataFrameReader.csv" in str(fn_new)
 
+    # Reader methods without a dedicated factory are looked up on the reader
+    fn_table = engine._get_reader_fn(reader=spark_session.read, reader_method="Table")
+    assert "<bound method DataFrameReader.table" in str(fn_table)
+
+    with pytest.raises(ge_exceptions.BatchKwargsError):
+        engine._get_reader_fn(reader=spark_session.read, reader_method="not_a_reader")
+
 
 def test_get_compute_domain_with_no_domain_kwargs(spark_session):
     pd_df = pd.DataFrame({"a": [1, 2, 3, 4], "b": [2, 3, 4, None]})
@@ -202,6 +213,66 @@ def test_get_compute_domain_with_row_condition(spark_session):
     assert accessor_kwargs == {}
 
 
+def test_get_compute_domain_reuses_persisted_row_condition_domain(spark_session):
+    df = spark_session.createDataFrame([(1, 2), (2, 3), (3, 4)], ["a", "b"])
+
+    engine = SparkDFExecutionEngine()
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+    domain_kwargs = {"row_condition": "b > 2", "condition_parser": "spark"}
+
+    data, _, _ = engine.get_compute_domain(
+        domain_kwargs=domain_kwargs, domain_type=MetricDomainTypes.TABLE,
+    )
+    same_data, _, _ = engine.get_compute_domain(
+        domain_kwargs=domain_kwargs, domain_type=MetricDomainTypes.TABLE,
+    )
+    assert same_data is data
+    assert data.is_cached
+
+    # Reloading the batch invalidates the domains computed on the old data
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+    assert not data.is_cached
+    new_data, _, _ = engine.get_compute_domain(
+        domain_kwargs=domain_kwargs, domain_type=MetricDomainTypes.TABLE,
+    )
+    assert new_data is not data
+    assert new_data.count() == 2
+
+    engine.unpersist_all()
+    assert not new_data.is_cached
+
+
+def test_get_compute_domain_only_keeps_the_most_recently_used_domains_persisted(
+    spark_session,
+):
+    df = spark_session.createDataFrame([(1, 2), (2, 3), (3, 4)], ["a", "b"])
+
+    engine = SparkDFExecutionEngine()
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+    domains = [
+        engine.get_compute_domain(
+            domain_kwargs={"row_condition": f"b > {idx}", "condition_parser": "spark"},
+            domain_type=MetricDomainTypes.TABLE,
+        )[0]
+        for idx in range(COMPUTE_DOMAIN_CACHE_SIZE)
+    ]
+    # Using the oldest domain again keeps it from being the next one evicted
+    engine.get_compute_domain(
+        domain_kwargs={"row_condition": "b > 0", "condition_parser": "spark"},
+        domain_type=MetricDomainTypes.TABLE,
+    )
+    engine.get_compute_domain(
+        domain_kwargs={"row_condition": "b > 100", "condition_parser": "spark"},
+        domain_type=MetricDomainTypes.TABLE,
+    )
+    assert domains[0].is_cached
+    assert not domains[1].is_cached
+    assert all(domain.is_cached for domain in domains[2:])
+    assert len(engine._compute_domain_cache) == COMPUTE_DOMAIN_CACHE_SIZE
+
+    engine.unpersist_all()
+
+
 # What happens when we filter such that no value meets the condition?
 def test_get_compute_domain_with_unmeetable_row_condition(spark_session):
     pd_df = pd.DataFrame({"a": [1, 2, 3, 4], "b": [2, 3, 4, None]})
@@ -259,6 +330,90 @@ def test_get_batch_data(test_sparkdf):
     assert len(test_sparkdf.columns) == 10
 
 
+def test_get_batch_data_persists_batch(test_sparkdf):
+    batch_data = SparkDFExecutionEngine().get_batch_data(
+        RuntimeDataBatchSpec(batch_data=test_sparkdf, cache_level="disk")
+    )
+    assert batch_data.storageLevel.useDisk
+    assert not batch_data.storageLevel.useMemory
+    test_sparkdf.unpersist()
+
+    batch_data = SparkDFExecutionEngine(persist=False).get_batch_data(
+        RuntimeDataBatchSpec(batch_data=test_sparkdf, cache_level="disk")
+    )
+    assert not batch_data.storageLevel.useMemory
+    assert not batch_data.storageLevel.useDisk
+
+
+def _is_persisted(df):
+    # is_cached is only tracked by the python DataFrame object that persist() was called on
+    storage_level = df.storageLevel
+    return storage_level.useMemory or storage_level.useDisk
+
+
+def test_get_batch_data_only_persists_batches_with_a_cache_level(
+    test_folder_connection_path_csv, test_sparkdf
+):
+    engine = SparkDFExecutionEngine()
+    batch_data = engine.get_batch_data(RuntimeDataBatchSpec(batch_data=test_sparkdf))
+    assert not _is_persisted(batch_data)
+    assert not _is_persisted(test_sparkdf)
+
+    batch_data = engine.get_batch_data(
+        PathBatchSpec(
+            path=os.path.join(test_folder_connection_path_csv, "test.csv"),
+            reader_options={"header": True},
+        )
+    )
+    assert not _is_persisted(batch_data)
+
+
+def test_load_batch_data_unpersists_replaced_batches(
+    test_folder_connection_path_csv, test_sparkdf
+):
+    engine = SparkDFExecutionEngine()
+    batch_spec = PathBatchSpec(
+        path=os.path.join(test_folder_connection_path_csv, "test.csv"),
+        reader_options={"header": True},
+        cache_level="memory",
+    )
+    batch_data = engine.get_batch_data(batch_spec)
+    assert _is_persisted(batch_data)
+
+    engine.load_batch_data("1234", batch_data)
+    engine.load_batch_data("1234", batch_data)
+    assert _is_persisted(batch_data)
+
+    # Loading the same batch again keeps it persisted, although Spark shares its cached data with the replaced one
+    new_batch_data = engine.get_batch_data(batch_spec)
+    engine.load_batch_data("1234", new_batch_data)
+    assert _is_persisted(new_batch_data)
+
+    batch_data = new_batch_data
+    new_batch_data = engine.get_batch_data(
+        PathBatchSpec(
+            path=os.path.join(test_folder_connection_path_csv, "test.csv"),
+            reader_options={"header": True},
+            sampling_method="_sample_using_a_list",
+            sampling_kwargs={"column_name": "col_1", "value_list": ["1", "2"]},
+            cache_level="memory",
+        )
+    )
+    engine.load_batch_data("1234", new_batch_data)
+    assert not _is_persisted(batch_data)
+    assert _is_persisted(new_batch_data)
+
+    engine.unpersist_all()
+    assert not _is_persisted(new_batch_data)
+
+    # DataFrames that the engine did not persist are left alone
+    test_sparkdf.cache()
+    engine.load_batch_data("5678", test_sparkdf)
+    engine.load_batch_data("5678", new_batch_data)
+    assert _is_persisted(test_sparkdf)
+    test_sparkdf.unpersist()
+
+
 def test_get_batch_empty_splitter(test_folder_connection_path_csv):
     # reader_method not configured because spark will configure own reader by default
     # reader_options are needed to specify the fact that the first line of test file is the header
@@ -404,6 +559,40 @@ def test_get_batch_with_split_on_converted_datetime(test_sparkdf):
     assert len(split_df.columns) == 10
 
 
+def test_get_batch_with_split_on_converted_datetime_by_month(test_sparkdf):
+    split_df = SparkDFExecutionEngine().get_batch_data(
+        RuntimeDataBatchSpec(
+            batch_data=test_sparkdf,
+            splitter_method="_split_on_converted_datetime",
+            splitter_kwargs={
+                "column_name": "timestamp",
+                "date_format_string": "yyyy-MM",
+                "partition_definition": {"timestamp": "2020-01"},
+            },
+        )
+    )
+    # All of the test data falls within January 2020
+    assert split_df.count() == 120
+    assert len(split_df.columns) == 10
+
+
+def test_get_batch_with_split_on_converted_datetime_by_day_of_month(test_sparkdf):
+    # Days of the month do not form a contiguous range, so the values are formatted and compared instead
+    split_df = SparkDFExecutionEngine().get_batch_data(
+        RuntimeDataBatchSpec(
+            batch_data=test_sparkdf,
+            splitter_method="_split_on_converted_datetime",
+            splitter_kwargs={
+                "column_name": "timestamp",
+                "date_format_string": "dd",
+                "partition_definition": {"timestamp": "03"},
+            },
+        )
+    )
+    assert split_df.count() == 2
+    assert len(split_df.columns) == 10
+
+
 def test_get_batch_with_split_on_divided_integer(test_sparkdf):
     split_df = SparkDFExecutionEngine().get_batch_data(
         RuntimeDataBatchSpec(
@@ -445,6 +634,64 @@ def test_get_batch_with_split_on_mod_integer(test_sparkdf):
     assert min_result.collect()[0]["min(id)"] == 5
 
 
+def test_get_batch_with_split_on_mod_integer_negative_values(spark_session):
+    df = spark_session.createDataFrame([(i,) for i in range(-10, 10)], ["id"])
+    split_df = SparkDFExecutionEngine().get_batch_data(
+        RuntimeDataBatchSpec(
+            batch_data=df,
+            splitter_method="_split_on_mod_integer",
+            splitter_kwargs={
+                "column_name": "id",
+                "mod": 10,
+                "partition_definition": {"id": 5},
+            },
+        )
+    )
+    # Matches python (and PandasExecutionEngine) modulo semantics
+    assert sorted(row.id for row in split_df.collect()) == [-5, 5]
+
+
+def test_get_batch_with_split_on_divided_integer_negative_values(spark_session):
+    df = spark_session.createDataFrame([(i,) for i in range(-25, 25)], ["id"])
+    split_df = SparkDFExecutionEngine().get_batch_data(
+        RuntimeDataBatchSpec(
+            batch_data=df,
+            splitter_method="_split_on_divided_integer",
+            splitter_kwargs={
+                "column_name": "id",
+                "divisor": 10,
+                "partition_definition": {"id": 0},
+            },
+        )
+    )
+    # Rounded towards zero, like PandasExecutionEngine
+    assert sorted(row.id for row in split_df.collect()) == list(range(-9, 10))
+
+
+@pytest.mark.parametrize(
+    "splitter_method,splitter_kwargs",
+    [
+        ("_split_on_divided_integer", {"divisor": 2.5}),
+        ("_split_on_mod_integer", {"mod": "10"}),
+    ],
+)
+def test_get_batch_with_split_on_a_non_integer_rejects_it(
+    test_sparkdf, splitter_method, splitter_kwargs
+):
+    with pytest.raises(ge_exceptions.ExecutionEngineError):
+        SparkDFExecutionEngine().get_batch_data(
+            RuntimeDataBatchSpec(
+                batch_data=test_sparkdf,
+                splitter_method=splitter_method,
+                splitter_kwargs={
+                    "column_name": "id",
+                    "partition_definition": {"id": 5},
+                    **splitter_kwargs,
+                },
+            )
+        )
+
+
 def test_get_batch_with_split_on_multi_column_values(test_sparkdf):
     split_df = SparkDFExecutionEngine().get_batch_data(
         RuntimeDataBatchSpec(
@@ -510,6 +757,76 @@ def test_get_batch_with_split_on_hashed_column(test_sparkdf):
     assert len(split_df.columns) == 10
 
 
+def test_native_hash_expression_hashes_spark_string_casts(spark_session):
+    # Native hashes see values as Spark casts them to strings, not as python's str() formats them
+    df = spark_session.createDataFrame(
+        [
+            (True, 1.0, datetime.datetime(2020, 1, 1, 12, 0)),
+            (False, 2.5, datetime.datetime(2020, 1, 2, 0, 0, 30)),
+            (None, None, None),
+        ],
+        ["flag", "x", "ts"],
+    )
+    hashed_rows = df.select(
+        *(
+            SparkDFExecutionEngine._native_hash_expression(
+                column_name=column_name, hash_digits=32, hash_function_name="md5"
+            ).alias(column_name)
+            for column_name in df.columns
+        )
+    ).collect()
+
+    def md5(value):
+        return hashlib.md5(value.encode()).hexdigest()
+
+    assert [tuple(row) for row in hashed_rows] == [
+        (md5("true"), md5("1.0"), md5("2020-01-01 12:00:00")),
+        (md5("false"), md5("2.5"), md5("2020-01-02 00:00:30")),
+        (None, None, None),
+    ]
+
+    # Nulls hash to null, so they are never sampled (they used to be hashed as "None")
+    sampled_df = SparkDFExecutionEngine().get_batch_data(
+        RuntimeDataBatchSpec(
+            batch_data=df.where(F.col("flag").isNull()),
+            sampling_method="_sample_using_hash",
+            sampling_kwargs={
+                "column_name": "flag",
+                "hash_digits": 32,
+                "hash_value": md5("None"),
+            },
+        )
+    )
+    assert sampled_df.count() == 0
+
+
+def test_get_batch_with_split_on_hashed_column_without_native_hash_function(
+    test_sparkdf,
+):
+    # blake2b has no Spark SQL counterpart, so the split falls back to hashing in python.
+    split_df = SparkDFExecutionEngine().get_batch_data(
+        RuntimeDataBatchSpec(
+            batch_data=test_sparkdf,
+            splitter_method="_split_on_hashed_column",
+            splitter_kwargs={
+                "column_name": "favorite_color",
+                "hash_digits": 1,
+                "hash_function_name": "blake2b",
+                "partition_definition": {"hash_value": "a",},
+            },
+        )
+    )
+    expected_count = len(
+        [
+            row
+            for row in test_sparkdf.collect()
+            if hashlib.blake2b(row.favorite_color.encode()).hexdigest()[-1:] == "a"
+        ]
+    )
+    assert split_df.count() == expected_count
+    assert len(split_df.columns) == 10
+
+
 # ### Sampling methods ###
 def test_get_batch_empty_sampler(test_sparkdf):
     sampled_df = SparkDFExecutionEngine().get_batch_data(
@@ -545,6 +862,17 @@ def test_sample_using_mod(test_sparkdf):
     assert len(sampled_df.columns) == 10
 
 
+def test_sample_using_mod_rejects_a_non_integer_mod(test_sparkdf):
+    with pytest.raises(ge_exceptions.ExecutionEngineError):
+        SparkDFExecutionEngine().get_batch_data(
+            RuntimeDataBatchSpec(
+                batch_data=test_sparkdf,
+                sampling_method="_sample_using_mod",
+                sampling_kwargs={"column_name": "id", "mod": 5.5, "value": 4},
+            )
+        )
+
+
 def test_sample_using_a_list(test_sparkdf):
     sampled_df = SparkDFExecutionEngine().get_batch_data(
         RuntimeDataBatchSpec(
@@ -557,6 +885,41 @@ def test_sample_using_a_list(test_sparkdf):
     assert len(sampled_df.columns) == 10
 
 
+def test_sample_using_a_long_list(test_sparkdf):
+    sampled_df = SparkDFExecutionEngine().get_batch_data(
+        RuntimeDataBatchSpec(
+            batch_data=test_sparkdf,
+            sampling_method="_sample_using_a_list",
+            sampling_kwargs={
+                "column_name": "id",
+                "value_list": [3, 5, 7, 11] + list(range(1000, 3000)),
+            },
+        )
+    )
+    assert sampled_df.count() == 4
+    assert len(sampled_df.columns) == 10
+    assert sorted(row.id for row in sampled_df.collect()) == [3, 5, 7, 11]
+
+
+def test_sample_using_a_long_list_on_a_column_named_value(spark_session):
+    df = spark_session.createDataFrame(
+        [(i, str(i)) for i in range(3000)], ["value", "x"]
+    )
+    sampled_df = SparkDFExecutionEngine().get_batch_data(
+        RuntimeDataBatchSpec(
+            batch_data=df,
+            sampling_method="_sample_using_a_list",
+            sampling_kwargs={
+                "column_name": "value",
+                "value_list": [3, 5, 7, 11] + list(range(5000, 7000)),
+            },
+        )
+    )
+    assert sampled_df.count() == 4
+    assert sampled_df.columns == ["value", "x"]
+    assert sorted(row.value for row in sampled_df.collect()) == [3, 5, 7, 11]
+
+
 def test_sample_using_md5_wrong_hash_function_name(test_sparkdf):
     with pytest.raises(ge_exceptions.ExecutionEngineError):
         sampled_df = SparkDFExecutionEngine().get_batch_data(
@@ -799,6 +1162,73 @@ def test_sparkdf_batch_aggregate_metrics(caplog, spark_session):
     assert found_message
 
 
+def test_collect_rows_matches_collect(spark_session):
+    df = spark_session.createDataFrame(
+        [
+            (1, 2.5, "a", True, datetime.date(2020, 1, 1)),
+            (None, None, None, None, None),
+        ],
+        ["int", "float", "string", "bool", "date"],
+    ).withColumn("timestamp", F.lit(datetime.datetime(2020, 1, 1, 12)))
+
+    simple_df = df.drop("timestamp")
+    assert [tuple(row) for row in SparkDFExecutionEngine._collect_rows(simple_df)] == [
+        tuple(row) for row in simple_df.collect()
+    ]
+
+    # Columns that Arrow would convert differently fall back to collect()
+    timestamp_df = df.select("timestamp").limit(1)
+    assert (
+        SparkDFExecutionEngine._collect_rows(timestamp_df)[0][0]
+        == timestamp_df.collect()[0][0]
+    )
+
+
+def test_collect_rows_without_arrow_collection_support(spark_session, monkeypatch):
+    monkeypatch.setattr(
+        "great_expectations.execution_engine.sparkdf_execution_engine.ARROW_COLLECT_SUPPORTED",
+        False,
+    )
+    df = spark_session.createDataFrame([(1, "a"), (2, "b")], ["int", "string"])
+    assert SparkDFExecutionEngine._collect_rows(df) == df.collect()
+
+
+def test_sparkdf_batch_aggregate_metrics_on_multiple_domains(spark_session):
+    engine = _build_spark_engine(
+        pd.DataFrame({"a": [1, 2, 1, 2, 3, 3], "b": [4, 4, 4, 4, 5, 5]})
+    )
+
+    partial_metrics = [
+        MetricConfiguration(
+            metric_name="column.max.aggregate_fn",
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs=dict(),
+        ),
+        MetricConfiguration(
+            metric_name="column.max.aggregate_fn",
+            metric_domain_kwargs={
+                "column": "a",
+                "row_condition": "b == 4",
+                "condition_parser": "spark",
+            },
+            metric_value_kwargs=dict(),
+        ),
+    ]
+    metrics = engine.resolve_metrics(metrics_to_resolve=partial_metrics)
+    desired_metrics = [
+        MetricConfiguration(
+            metric_name="column.max",
+            metric_domain_kwargs=partial_metric.metric_domain_kwargs,
+            metric_value_kwargs=dict(),
+            metric_dependencies={"metric_partial_fn": partial_metric},
+        )
+        for partial_metric in partial_metrics
+    ]
+    res = engine.resolve_metrics(metrics_to_resolve=desired_metrics, metrics=metrics)
+    assert res[desired_metrics[0].id] == 3
+    assert res[desired_metrics[1].id] == 2
+
+
 # Ensuring functionality of compute_domain when no domain kwargs are given
 def test_get_compute_domain_with_no_domain_kwargs():
     engine = _build_spark_engine(
@@ -1113,3 +1543,25 @@ def test_dataframe_property_given_loaded_batch():
 
     # Ensuring Data not distorted
     assert engine.dataframe == df
+
+
+def test_head_does_not_change_session_config(spark_session):
+    engine = SparkDFExecutionEngine()
+    df = spark_session.createDataFrame([(i,) for i in range(10)], ["a"])
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+    config_before = dict(spark_session.sparkContext.getConf().getAll())
+    runtime_config_before = {
+        key: spark_session.conf.get(key, None)
+        for key in [
+            "spark.sql.execution.arrow.pyspark.enabled",
+            "spark.sql.execution.arrow.enabled",
+        ]
+    }
+
+    head = engine.head(n=3)
+    assert head["a"].tolist() == [0, 1, 2]
+
+    assert dict(spark_session.sparkContext.getConf().getAll()) == config_before
+    assert {
+        key: spark_session.conf.get(key, None) for key in runtime_config_before
+    } == runtime_config_before
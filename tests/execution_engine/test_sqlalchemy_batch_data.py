@@ -31,6 +31,15 @@ def test_instantiation_with_table_name(sqlite_view_engine):
     assert batch_data.use_quoted_name == False
 
 
+def test_instantiation_with_table_name_and_schema_name(sqlite_view_engine):
+    batch_data = SqlAlchemyBatchData(
+        engine=sqlite_view_engine, schema_name="main", table_name="test_table",
+    )
+
+    assert batch_data.selectable.schema == "main"
+    assert batch_data.row_count() == 5
+
+
 def test_instantiation_with_query():
     # Note Abe 20111119: Fill this in
     pass
@@ -291,6 +291,31 @@ def test_map_unique_pd():
     assert list(results[desired_metric.id][0]) == [False, False, True, True]
 
 
+def test_map_not_match_like_pattern_list_pd(monkeypatch):
+    from great_expectations.expectations.metrics.column_map_metrics.column_values_not_match_like_pattern_list import (
+        ColumnValuesNotMatchLikePatternList,
+    )
+
+    engine = _build_pandas_engine(
+        pd.DataFrame({"a": ["ab", "ab\n", "xbc", "nan", None]})
+    )
+    desired_metric = MetricConfiguration(
+        metric_name="column_values.not_match_like_pattern_list.condition",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"like_pattern_list": ["_b", "n_n", "N%"]},
+    )
+
+    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,))
+    assert list(results[desired_metric.id][0]) == [True, False, False, True]
+
+    # Null values match no pattern, even when they are not filtered out beforehand
+    monkeypatch.setattr(
+        ColumnValuesNotMatchLikePatternList, "filter_column_isnull", False
+    )
+    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,))
+    assert list(results[desired_metric.id][0]) == [True, False, False, True, False]
+
+
 def test_map_unique_spark(spark_session):
     engine = _build_spark_engine(
         pd.DataFrame(
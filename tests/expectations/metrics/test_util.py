@@ -0,0 +1,39 @@
+import re
+
+from great_expectations.expectations.metrics.util import get_like_pattern_list_regex
+
+
+def test_get_like_pattern_list_regex_matches_whole_values():
+    regex = re.compile(get_like_pattern_list_regex(["a%", "_b"]))
+
+    assert regex.match("abc")
+    assert regex.match("a\nc")
+    assert regex.match("xb")
+    assert not regex.match("xbc")
+    # A trailing newline is part of the value
+    assert not regex.match("xb\n")
+
+
+def test_get_like_pattern_list_regex_matches_escaped_wildcards_literally():
+    regex = re.compile(
+        get_like_pattern_list_regex(["100\\%", "a\\_b", "c\\\\d", "e\\"])
+    )
+
+    assert regex.match("100%")
+    assert not regex.match("1000")
+    assert regex.match("a_b")
+    assert not regex.match("axb")
+    assert regex.match("c\\d")
+    assert regex.match("e\\")
+
+
+def test_get_like_pattern_list_regex_for_spark(spark_session):
+    df = spark_session.createDataFrame(
+        [("ab",), ("ab\n",), ("xb",), ("a_b",), ("axb",)], ["value"]
+    )
+    regex = get_like_pattern_list_regex(["a_", "a\\_b"], spark=True)
+
+    assert sorted(row.value for row in df.filter(df.value.rlike(regex)).collect()) == [
+        "a_b",
+        "ab",
+    ]
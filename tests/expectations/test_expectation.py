@@ -0,0 +1,373 @@
+import pytest
+
+from great_expectations.core.expectation_configuration import (
+    ExpectationConfiguration,
+    parse_result_format,
+)
+from great_expectations.core.expectation_validation_result import (
+    ExpectationValidationResult,
+)
+from great_expectations.exceptions import InvalidExpectationConfigurationError
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.expectations.core.expect_column_pair_values_to_be_in_set import (
+    ExpectColumnPairValuesToBeInSet,
+)
+from great_expectations.expectations.core.expect_column_values_to_be_in_set import (
+    ExpectColumnValuesToBeInSet,
+)
+from great_expectations.expectations.expectation import (
+    _count_to_str,
+    _format_map_output,
+    camel_to_snake,
+)
+from great_expectations.expectations.registry import _registered_expectations
+from great_expectations.render.util import num_to_str
+
+
+def test_get_runtime_kwargs_does_not_mutate_configuration():
+    configuration = ExpectationConfiguration(
+        expectation_type="expect_column_values_to_be_in_set",
+        kwargs={
+            "column": "PClass",
+            "value_set": [1, 2, 3],
+            "result_format": {"result_format": "SUMMARY"},
+        },
+    )
+    expectation = ExpectColumnValuesToBeInSet(configuration)
+
+    runtime_kwargs = expectation.get_runtime_kwargs(
+        runtime_configuration={"catch_exceptions": True}
+    )
+
+    assert runtime_kwargs["column"] == "PClass"
+    assert runtime_kwargs["value_set"] == [1, 2, 3]
+    assert runtime_kwargs["catch_exceptions"] is True
+    assert runtime_kwargs["result_format"] == {
+        "result_format": "SUMMARY",
+        "partial_unexpected_count": 20,
+    }
+    assert configuration.kwargs == {
+        "column": "PClass",
+        "value_set": [1, 2, 3],
+        "result_format": {"result_format": "SUMMARY"},
+    }
+
+
+def test_kwargs_tiers_are_nested():
+    configuration = ExpectationConfiguration(
+        expectation_type="expect_column_values_to_be_in_set",
+        kwargs={"column": "PClass", "value_set": [1, 2, 3]},
+    )
+    expectation = ExpectColumnValuesToBeInSet(configuration)
+
+    domain_kwargs = expectation.get_domain_kwargs()
+    success_kwargs = expectation.get_success_kwargs()
+    runtime_kwargs = expectation.get_runtime_kwargs()
+
+    assert set(domain_kwargs) == set(ExpectColumnValuesToBeInSet.domain_keys)
+    assert set(success_kwargs) == set(
+        ExpectColumnValuesToBeInSet.domain_keys
+        + ExpectColumnValuesToBeInSet.success_keys
+    )
+    assert set(runtime_kwargs) == set(
+        ExpectColumnValuesToBeInSet.get_allowed_config_keys()
+    )
+    assert domain_kwargs.items() <= success_kwargs.items()
+    assert success_kwargs["mostly"] == 1
+    assert runtime_kwargs["result_format"] == {
+        "result_format": "BASIC",
+        "partial_unexpected_count": 20,
+    }
+
+
+def test_kwargs_tiers_accept_keys_declared_as_lists():
+    class _ExpectColumnValuesToBeInListedSet(ExpectColumnValuesToBeInSet):
+        success_keys = ["value_set", "mostly"]
+
+    configuration = ExpectationConfiguration(
+        expectation_type="expect_column_values_to_be_in_set",
+        kwargs={"column": "PClass", "value_set": [1, 2, 3]},
+    )
+    expectation = _ExpectColumnValuesToBeInListedSet(configuration)
+
+    assert set(expectation.get_success_kwargs()) == set(
+        ExpectColumnValuesToBeInSet.domain_keys
+    ) | {"value_set", "mostly"}
+    assert "result_format" in expectation.get_runtime_kwargs()
+
+
+def test_core_expectations_have_no_instance_dict():
+    configuration = ExpectationConfiguration(
+        expectation_type="expect_column_values_to_be_in_set",
+        kwargs={"column": "PClass", "value_set": [1, 2, 3]},
+    )
+    assert not hasattr(ExpectColumnValuesToBeInSet(configuration), "__dict__")
+
+    core_expectations = [
+        expectation
+        for expectation in _registered_expectations.values()
+        if expectation.__module__.startswith("great_expectations.expectations.core.")
+    ]
+    assert len(core_expectations) > 0
+    for expectation in core_expectations:
+        assert not hasattr(expectation.__new__(expectation), "__dict__"), expectation
+
+
+def test_get_result_format_precedence():
+    configuration = ExpectationConfiguration(
+        expectation_type="expect_column_values_to_be_in_set",
+        kwargs={"column": "PClass", "value_set": [1, 2, 3]},
+    )
+    expectation = ExpectColumnValuesToBeInSet(configuration)
+
+    assert expectation.get_result_format(configuration) == "BASIC"
+    configuration.kwargs["result_format"] = "SUMMARY"
+    assert expectation.get_result_format(configuration, {}) == "SUMMARY"
+    assert (
+        expectation.get_result_format(configuration, {"catch_exceptions": True})
+        == "SUMMARY"
+    )
+    assert (
+        expectation.get_result_format(configuration, {"result_format": "COMPLETE"})
+        == "COMPLETE"
+    )
+
+
+def test_diagnostic_unexpected_table_renderer_labels_counts():
+    result = ExpectationValidationResult(
+        success=False,
+        result={
+            "unexpected_count": 6,
+            "partial_unexpected_counts": [
+                {"value": "a", "count": 3},
+                {"value": "", "count": 2},
+                {"value": None, "count": 1},
+            ],
+        },
+    )
+    table = ExpectColumnValuesToBeInSet._diagnostic_unexpected_table_renderer(
+        result=result
+    )
+    assert table.header_row == ["Unexpected Value", "Count"]
+    assert table.table == [["a", 3], ["EMPTY", 2], ["null", 1]]
+
+    result.result["unexpected_count"] = 7
+    table = ExpectColumnValuesToBeInSet._diagnostic_unexpected_table_renderer(
+        result=result
+    )
+    assert table.header_row == ["Sampled Unexpected Values"]
+    assert table.table == [["a"], ["EMPTY"], ["null"]]
+
+
+def test_diagnostic_unexpected_table_renderer_deduplicates_sampled_values():
+    result = ExpectationValidationResult(
+        success=False,
+        result={"partial_unexpected_list": ["a", "", None, "a", 0, "", 1, 1]},
+    )
+    table = ExpectColumnValuesToBeInSet._diagnostic_unexpected_table_renderer(
+        result=result
+    )
+    assert table.header_row == ["Sampled Unexpected Values"]
+    assert table.table == [["a"], [""], [None], [1]]
+
+
+def test_count_to_str_matches_num_to_str():
+    for count in [0, 7, -5, 1313, 123456789, 2 ** 53, 10 ** 20 + 3, 2.0, 1313.5]:
+        assert _count_to_str(count) == num_to_str(count, use_locale=True, precision=20)
+
+
+def test_camel_to_snake():
+    assert (
+        camel_to_snake("ExpectColumnValuesToBeInSet")
+        == "expect_column_values_to_be_in_set"
+    )
+    assert camel_to_snake("ExpectColumnKLDivergence") == "expect_column_kl_divergence"
+    assert camel_to_snake("ExpectColumnValuesToBeJSONParseable") == (
+        "expect_column_values_to_be_json_parseable"
+    )
+    assert camel_to_snake("Expect2ColumnsToMatch") == "expect2_columns_to_match"
+    assert camel_to_snake("Expect_Column") == "expect__column"
+
+
+def test_build_configuration_does_not_share_kwargs(monkeypatch):
+    monkeypatch.setattr(
+        ExpectColumnValuesToBeInSet,
+        "validation_kwargs",
+        ("column", "value_set"),
+        raising=False,
+    )
+    monkeypatch.setattr(
+        ExpectColumnValuesToBeInSet,
+        "default_expectation_args",
+        {"include_config": True, "catch_exceptions": False, "result_format": "BASIC"},
+        raising=False,
+    )
+    value_set = [1, 2, 3]
+    result_format = {"result_format": "SUMMARY"}
+
+    configuration = ExpectColumnValuesToBeInSet.build_configuration(
+        "PClass", value_set, result_format=result_format, include_config=False
+    )
+
+    assert configuration.kwargs == {
+        "column": "PClass",
+        "value_set": [1, 2, 3],
+        "result_format": {"result_format": "SUMMARY"},
+    }
+    configuration.kwargs["value_set"].append(4)
+    configuration.kwargs["result_format"]["partial_unexpected_count"] = 10
+    assert value_set == [1, 2, 3]
+    assert result_format == {"result_format": "SUMMARY"}
+
+
+def test_default_kwarg_values_are_read_only():
+    with pytest.raises(TypeError):
+        ExpectColumnValuesToBeInSet.default_kwarg_values["mostly"] = 0.5
+    assert ExpectColumnValuesToBeInSet.default_kwarg_values["mostly"] == 1
+
+
+def test_diagnostic_renderers_render_raised_exceptions():
+    result = ExpectationValidationResult(
+        success=False,
+        expectation_config=ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_in_set",
+            kwargs={"column": "PClass", "value_set": [1, 2, 3]},
+        ),
+        exception_info={
+            "raised_exception": True,
+            "exception_message": "Boom",
+            "exception_traceback": "Traceback...",
+        },
+    )
+
+    status_icon = ExpectColumnValuesToBeInSet._diagnostic_status_icon_renderer(
+        result=result
+    )
+    assert status_icon.string_template["params"]["markdown_status_icon"] == "❗"
+
+    (
+        exception_message,
+        traceback_collapse,
+    ) = ExpectColumnValuesToBeInSet._diagnostic_unexpected_statement_renderer(
+        result=result
+    )
+    assert exception_message.string_template["params"] == {
+        "expectation_type": "expect_column_values_to_be_in_set",
+        "exception_message": "Boom",
+    }
+    assert traceback_collapse.collapse[0].string_template == {
+        "template": "Traceback...",
+        "tag": "code",
+    }
+
+
+def test_map_metric_dependency_names_by_result_format():
+    get_names = ExpectColumnValuesToBeInSet._get_metric_dependency_names
+    base = (
+        "column_values.nonnull.unexpected_count",
+        "column_values.in_set.unexpected_count",
+        "table.row_count",
+    )
+    assert get_names("BOOLEAN_ONLY", None) == base
+    for result_format in ["BASIC", "SUMMARY"]:
+        assert get_names(result_format, None) == base + (
+            "column_values.in_set.unexpected_values",
+        )
+    assert get_names("COMPLETE", None) == base + (
+        "column_values.in_set.unexpected_values",
+        "column_values.in_set.unexpected_rows",
+    )
+    assert get_names("COMPLETE", PandasExecutionEngine()) == base + (
+        "column_values.in_set.unexpected_values",
+        "column_values.in_set.unexpected_rows",
+        "column_values.in_set.unexpected_index_list",
+    )
+
+
+def test_map_expectations_require_their_domain_kwargs():
+    configuration = ExpectationConfiguration(
+        expectation_type="expect_column_pair_values_to_be_in_set",
+        kwargs={"column_A": "a", "value_pairs_set": [(1, 1)]},
+    )
+    with pytest.raises(InvalidExpectationConfigurationError) as e:
+        ExpectColumnPairValuesToBeInSet(configuration)
+    assert (
+        str(e.value)
+        == "'column_B' parameter is required for column pair map expectations"
+    )
+
+    configuration = ExpectationConfiguration(
+        expectation_type="expect_column_values_to_be_in_set",
+        kwargs={"value_set": [1, 2, 3]},
+    )
+    with pytest.raises(InvalidExpectationConfigurationError) as e:
+        ExpectColumnValuesToBeInSet(configuration)
+    assert str(e.value) == "'column' parameter is required for column map expectations"
+
+    configuration = ExpectationConfiguration(
+        expectation_type="expect_column_values_to_be_in_set",
+        kwargs={"column": "PClass", "value_set": [1, 2, 3], "mostly": 1.5},
+    )
+    with pytest.raises(InvalidExpectationConfigurationError) as e:
+        ExpectColumnValuesToBeInSet(configuration)
+    assert str(e.value) == "'mostly' parameter must be between 0 and 1"
+
+
+def test_format_map_output_for_an_empty_batch():
+    result = _format_map_output(
+        result_format=parse_result_format("BASIC"),
+        success=True,
+        element_count=0,
+        nonnull_count=0,
+        unexpected_count=0,
+        unexpected_list=[],
+        unexpected_index_list=None,
+    )
+    assert result == {
+        "success": True,
+        "result": {
+            "element_count": 0,
+            "unexpected_count": 0,
+            "unexpected_percent": None,
+            "partial_unexpected_list": [],
+            "missing_count": 0,
+            "missing_percent": None,
+            "unexpected_percent_nonmissing": None,
+        },
+    }
+
+    result = _format_map_output(
+        result_format=parse_result_format("COMPLETE"),
+        success=True,
+        element_count=0,
+        nonnull_count=None,
+        unexpected_count=0,
+        unexpected_list=[],
+        unexpected_index_list=[],
+    )
+    assert result == {
+        "success": True,
+        "result": {
+            "element_count": 0,
+            "unexpected_count": 0,
+            "unexpected_percent": None,
+            "partial_unexpected_list": [],
+            "partial_unexpected_index_list": [],
+            "partial_unexpected_counts": [],
+            "unexpected_list": [],
+            "unexpected_index_list": [],
+        },
+    }
+
+
+def test_format_map_output_rejects_unknown_result_format():
+    with pytest.raises(ValueError):
+        _format_map_output(
+            result_format={"result_format": "VERBOSE", "partial_unexpected_count": 20},
+            success=True,
+            element_count=3,
+            nonnull_count=3,
+            unexpected_count=0,
+            unexpected_list=[],
+            unexpected_index_list=None,
+        )
@@ -2,7 +2,11 @@ from great_expectations.core.expectation_configuration import ExpectationConfigu
 from great_expectations.expectations.core.expect_column_values_to_be_in_set import (
     ExpectColumnValuesToBeInSet,
 )
-from great_expectations.expectations.registry import get_expectation_impl
+from great_expectations.expectations.registry import (
+    get_expectation_impl,
+    get_metric_kwargs,
+    get_metric_kwargs_batch,
+)
 
 
 def test_registry_basics():
@@ -16,3 +20,22 @@ def test_registry_from_configuration():
         kwargs={"column": "PClass", "value_set": [1, 2, 3]},
     )
     assert configuration._get_expectation_impl() == ExpectColumnValuesToBeInSet
+
+
+def test_get_metric_kwargs_batch_matches_get_metric_kwargs():
+    # Importing the metrics package registers the metric definitions
+    import great_expectations.expectations.metrics  # noqa: F401
+
+    configuration = ExpectationConfiguration(
+        expectation_type="expect_column_values_to_be_in_set",
+        kwargs={"column": "PClass", "value_set": [1, 2, 3], "mostly": 0.9},
+    )
+    metric_names = ("column_values.in_set.unexpected_count", "table.row_count")
+    batch_metric_kwargs = get_metric_kwargs_batch(
+        metric_names=metric_names, configuration=configuration
+    )
+    assert list(batch_metric_kwargs) == list(metric_names)
+    for metric_name in metric_names:
+        assert batch_metric_kwargs[metric_name] == get_metric_kwargs(
+            metric_name=metric_name, configuration=configuration
+        )
@@ -1038,6 +1038,7 @@ def candidate_test_is_on_temporary_notimplemented_list(context, expectation_type
             # "expect_column_values_to_not_match_regex",
             # "expect_column_values_to_match_regex_list",
             "expect_column_values_to_not_match_regex_list",
+            "expect_column_values_to_not_match_like_pattern_list",
             # "expect_column_values_to_match_strftime_format",
             "expect_column_values_to_be_dateutil_parseable",
             "expect_column_values_to_be_json_parseable",
@@ -1069,6 +1070,7 @@ def candidate_test_is_on_temporary_notimplemented_list(context, expectation_type
     if context == "PandasDataset":
         return expectation_type in [
             "expect_table_row_count_to_equal_other_table",
+            "expect_column_values_to_not_match_like_pattern_list",
         ]
     return False
 
@@ -89,7 +89,7 @@ def candidate_test_is_on_temporary_notimplemented_list_cfe(context, expectation_
             "expect_column_values_to_match_like_pattern",
             "expect_column_values_to_not_match_like_pattern",
             "expect_column_values_to_match_like_pattern_list",
-            "expect_column_values_to_not_match_like_pattern_list",
+            # "expect_column_values_to_not_match_like_pattern_list",
             # "expect_column_values_to_match_strftime_format",
             "expect_column_values_to_be_dateutil_parseable",
             # "expect_column_values_to_be_json_parseable",
@@ -149,7 +149,7 @@ def candidate_test_is_on_temporary_notimplemented_list_cfe(context, expectation_
             "expect_column_values_to_match_like_pattern",
             "expect_column_values_to_not_match_like_pattern",
             "expect_column_values_to_match_like_pattern_list",
-            "expect_column_values_to_not_match_like_pattern_list",
+            # "expect_column_values_to_not_match_like_pattern_list",
             # "expect_column_values_to_match_strftime_format",
             # "expect_column_values_to_be_dateutil_parseable",
             # "expect_column_values_to_be_json_parseable",